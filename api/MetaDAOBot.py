@@ -1,16 +1,36 @@
+import argparse
+import atexit
+import concurrent.futures
 import json
 import logging
-from telegram.ext import Application, ConversationHandler, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardRemove, BotCommand, BotCommandScopeAllPrivateChats, BotCommandScopeAllGroupChats
-from telegram.request import HTTPXRequest
+from telegram.ext import Application, BasePersistence, BaseUpdateProcessor, ConversationHandler, CommandHandler, MessageHandler, CallbackQueryHandler, PersistenceInput, TypeHandler, filters, ContextTypes
+from telegram import Bot, User, Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardRemove, BotCommand, BotCommandScopeAllPrivateChats, BotCommandScopeAllGroupChats
 import os
 from datetime import datetime
-import gspread
-from google.oauth2.service_account import Credentials
 from http.server import BaseHTTPRequestHandler
 import asyncio
+import heapq
+import hashlib
+import html
+import math
+import mmap
+import queue
 import re
-from groq import Groq
+import signal
+import sqlite3
+import struct
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Callable, Optional
+from telegram.error import BadRequest
 
 # Enable logging
 logging.basicConfig(
@@ -22,13 +42,8 @@ logger = logging.getLogger(__name__)
 # States for support conversation
 SUPPORT_CATEGORY, NAME, EMAIL, QUESTION, IMAGE_URL = range(5)
 
-# States for get_listed conversation
-(GET_LISTED_CONFIRM, FOUNDER_EMAIL, PROJECT_EMAIL, PROJECT_NAME_SHORT, PROJECT_CATEGORY, PROJECT_DESC_LONG, TOKEN_NAME, TOKEN_TICKER, 
- PROJECT_IMAGE, TOKEN_IMAGE, MIN_RAISE, MONTHLY_BUDGET, PERFORMANCE_PACKAGE, 
- PERFORMANCE_UNLOCK_TIME, INTELLECTUAL_PROPERTY, DOMAIN, DISCORD, 
- TELEGRAM_LINK, DOCS, X_TWITTER, GITHUB, YOUTUBE, MEDIUM, CALENDLY, 
- INSIDER_PAYOUT_ADDRESS, SPENDING_LIMIT_ADDRESSES, X_ARTICLE, FOUNDERS_SOCIALS,
- TEAM_BACKGROUND, TIMELINE, RECOGNITION, COMPETITORS_VISION, MISC) = range(12, 45)
+# States for get_listed conversation - each form step's state follows GET_LISTED_CONFIRM
+GET_LISTED_CONFIRM = 12
 
 # Secrets from env vars
 BOT_TOKEN = os.environ.get('BOT_TOKEN')
@@ -40,9 +55,22 @@ SHEET_NAME = os.environ.get('SHEET_NAME', 'MetaDAO Get Listed Requests')
 GROQ_API_KEY = os.environ.get('GROQ_API_KEY')
 if not GROQ_API_KEY:
     logger.warning("GROQ_API_KEY env var missing—AI responses disabled")
-    groq_client = None
-else:
-    groq_client = Groq(api_key=GROQ_API_KEY)
+
+# Heavy SDKs (groq, gspread, google-auth) are imported on first use rather than at module
+# import, so cold starts that never touch AI or Sheets don't pay for them
+_groq_client = None
+
+def get_groq_client():
+    """AsyncGroq client, constructed on first use - None when GROQ_API_KEY is not set"""
+    global _groq_client
+    if _groq_client is None and GROQ_API_KEY:
+        from groq import AsyncGroq
+        _groq_client = AsyncGroq(api_key=GROQ_API_KEY)
+    return _groq_client
+
+# Streaming AI replies - partial answers are pushed with throttled message edits
+AI_STREAM_EDIT_INTERVAL = float(os.environ.get('AI_STREAM_EDIT_INTERVAL', 1.0))
+AI_STREAM_MIN_CHARS = int(os.environ.get('AI_STREAM_MIN_CHARS', 40))
 
 # Google Sheets setup
 GOOGLE_CREDENTIALS_JSON = os.environ.get('GOOGLE_CREDENTIALS')
@@ -123,15 +151,67 @@ def proposals_inline_keyboard():
     ]
     return InlineKeyboardMarkup(keyboard)
 
-def get_sheets_client(sheet_name='Support Requests'):
-    try:
-        if not GOOGLE_CREDENTIALS:
-            logger.warning("Google Sheets credentials not provided")
-            return None
-        scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-        creds = Credentials.from_service_account_info(GOOGLE_CREDENTIALS, scopes=scopes)
-        client = gspread.authorize(creds)
-        
+# Sheets session cache - credentials, authorized client, spreadsheet and worksheet
+# handles survive across invocations on a warm instance. The authorized session
+# refreshes its access token by itself, only once the current one has expired.
+SHEETS_WORKSHEET_TTL = int(os.environ.get('SHEETS_WORKSHEET_TTL', 1800))
+SHEETS_WORKSHEET_CACHE_SIZE = int(os.environ.get('SHEETS_WORKSHEET_CACHE_SIZE', 64))
+# 'table' appends every Get Listed submission as a row of one sheet, 'tabs' gives each project its own tab
+GET_LISTED_STORAGE = os.environ.get('GET_LISTED_STORAGE', 'tabs').lower()
+SUPPORT_TABLE = 'Support Requests'
+GET_LISTED_TABLE = 'Get Listed'
+_sheets_session = {
+    'credentials': None,
+    'client': None,
+    'spreadsheet': None,
+    'worksheets': {},  # title -> (worksheet, cached_at)
+}
+# The Sheets writer thread and asyncio.to_thread replays share the session
+_sheets_session_lock = threading.RLock()
+
+def reset_sheets_session(sheet_name=None):
+    """Drop a cached worksheet handle, or the whole Sheets session when no name is given"""
+    with _sheets_session_lock:
+        if sheet_name is not None:
+            _sheets_session['worksheets'].pop(sheet_name, None)
+            return
+        _sheets_session['credentials'] = None
+        _sheets_session['client'] = None
+        _sheets_session['spreadsheet'] = None
+        _sheets_session['worksheets'].clear()
+
+def _is_sheets_auth_error(error):
+    import gspread
+    from google.auth.exceptions import RefreshError
+    if isinstance(error, RefreshError):
+        return True
+    if isinstance(error, gspread.exceptions.APIError):
+        return getattr(error.response, 'status_code', None) in (401, 403)
+    return False
+
+def handle_sheets_error(sheet_name, error):
+    """Evict cached handles that may be stale after a failed Sheets call"""
+    if _is_sheets_auth_error(error):
+        logger.warning(f"Sheets auth error, dropping cached session: {error}")
+        reset_sheets_session()
+    else:
+        reset_sheets_session(sheet_name)
+
+def _get_spreadsheet():
+    with _sheets_session_lock:
+        if _sheets_session['spreadsheet'] is not None:
+            return _sheets_session['spreadsheet']
+
+        import gspread
+        from google.oauth2.service_account import Credentials
+
+        if _sheets_session['client'] is None:
+            scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+            creds = Credentials.from_service_account_info(GOOGLE_CREDENTIALS, scopes=scopes)
+            _sheets_session['credentials'] = creds
+            _sheets_session['client'] = gspread.authorize(creds)
+        client = _sheets_session['client']
+
         try:
             spreadsheet = client.open(SHEET_NAME)
         except gspread.exceptions.SpreadsheetNotFound:
@@ -143,105 +223,110 @@ def get_sheets_client(sheet_name='Support Requests'):
             except Exception as e:
                 logger.error(f"Failed to create spreadsheet '{SHEET_NAME}': {e}")
                 return None
-        
-        # Try to get the sheet by name, create if it doesn't exist
-        try:
-            sheet = spreadsheet.worksheet(sheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            logger.info(f"Sheet '{sheet_name}' not found in spreadsheet '{SHEET_NAME}', creating it...")
-            try:
-                sheet = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=50)
-                if sheet_name == 'Support Requests':
-                    headers = ['Timestamp', 'Name', 'Email', 'Question', 'Category', 'Subcategory', 'Image URL']
-                    sheet.append_row(headers)
-                    logger.info(f"Created sheet '{sheet_name}' with horizontal layout")
-                else:
-                    logger.info(f"Created sheet '{sheet_name}' with vertical layout")
-            except Exception as e:
-                logger.error(f"Failed to create sheet '{sheet_name}': {e}")
+
+        _sheets_session['spreadsheet'] = spreadsheet
+        return spreadsheet
+
+def _cache_worksheet(sheet_name, sheet):
+    with _sheets_session_lock:
+        worksheets = _sheets_session['worksheets']
+        worksheets.pop(sheet_name, None)
+        while len(worksheets) >= SHEETS_WORKSHEET_CACHE_SIZE:
+            # Dicts keep insertion order, so the first entry is the oldest
+            worksheets.pop(next(iter(worksheets)), None)
+        worksheets[sheet_name] = (sheet, time.monotonic())
+
+def get_sheets_client(sheet_name=SUPPORT_TABLE):
+    try:
+        if not GOOGLE_CREDENTIALS:
+            logger.warning("Google Sheets credentials not provided")
+            return None
+
+        # Held across the cold path so concurrent writers don't authorize or open the same tab twice
+        with _sheets_session_lock:
+            cached = _sheets_session['worksheets'].get(sheet_name)
+            if cached and time.monotonic() - cached[1] < SHEETS_WORKSHEET_TTL:
+                return cached[0]
+            reset_sheets_session(sheet_name)
+
+            spreadsheet = _get_spreadsheet()
+            if spreadsheet is None:
                 return None
-        
-        return sheet
+            import gspread
+
+            # Try to get the sheet by name, create if it doesn't exist
+            try:
+                sheet = spreadsheet.worksheet(sheet_name)
+            except gspread.exceptions.WorksheetNotFound:
+                logger.info(f"Sheet '{sheet_name}' not found in spreadsheet '{SHEET_NAME}', creating it...")
+                try:
+                    sheet = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=50)
+                    headers = SHEET_TABLE_HEADERS.get(sheet_name)
+                    if headers:
+                        sheet.append_row(headers)
+                        logger.info(f"Created sheet '{sheet_name}' with horizontal layout")
+                    else:
+                        logger.info(f"Created sheet '{sheet_name}' with vertical layout")
+                except Exception as e:
+                    logger.error(f"Failed to create sheet '{sheet_name}': {e}")
+                    return None
+
+            _cache_worksheet(sheet_name, sheet)
+            return sheet
     except Exception as e:
         logger.error(f"Error setting up Google Sheets for sheet '{sheet_name}': {e}", exc_info=True)
+        handle_sheets_error(sheet_name, e)
         return None
 
-def log_request(name, email, question, category, subcategory=None, image_url=None, extra_data=None):
+def get_next_free_column(sheet):
+    """Next free column for the vertical layout, read from the header row on every write -
+    other instances and the replay CLI append to the same tabs, so a cached cursor goes stale"""
+    first_row = sheet.row_values(1)
+    filled_cols = len([cell for cell in first_row if cell.strip()])
+    return filled_cols + 1  # Column A when the sheet is empty
+
+def project_sheet_title(project_name):
+    """Worksheet title for a project - invalid characters and spaces replaced, at most 31 characters"""
+    title = project_name.strip()
+    invalid_chars = ['/', '\\', '?', '*', '[', ']', ':']
+    for char in invalid_chars:
+        title = title.replace(char, '_')
+    title = re.sub(r'\s+', '_', title)  # Replace spaces with underscores
+    if len(title) > 31:
+        title = title[:31].rstrip('_')
+    return title
+
+def log_request(name, email, question, category, subcategory=None, image_url=None, extra_data=None, timestamp=None):
+    """Write one submission to Google Sheets, returns True once it is stored"""
     if category == 'Support Request':
-        sheet_name = 'Support Requests'
+        sheet_name = SUPPORT_TABLE
     elif category == 'Get Listed':
-        sheet_name = extra_data['project_name_short'].strip()
-        # Sanitize sheet name
-        invalid_chars = ['/', '\\', '?', '*', '[', ']', ':']
-        for char in invalid_chars:
-            sheet_name = sheet_name.replace(char, '_')
-        sheet_name = re.sub(r'\s+', '_', sheet_name)  # Replace spaces with underscores
-        if len(sheet_name) > 31:
-            sheet_name = sheet_name[:31].rstrip('_')
-        if not sheet_name:
-            sheet_name = f"Project_{extra_data['founder_id']}"
+        sheet_name = project_sheet_title(extra_data['project_name_short']) or f"Project_{extra_data['founder_id']}"
     else:
-        sheet_name = 'Support Requests'
+        sheet_name = SUPPORT_TABLE
 
     sheet = get_sheets_client(sheet_name)
     
     if sheet:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         if category == 'Support Request':
             row = [timestamp, name, email, question, category, subcategory or '', image_url or '']
             try:
                 sheet.append_row(row)
                 logger.info(f"Request logged to '{sheet_name}' sheet: {name}, {email}, {category}, {subcategory}")
+                return True
             except Exception as e:
                 logger.error(f"Failed to append row to '{sheet_name}': {e}")
+                handle_sheets_error(sheet_name, e)
         else:
             # Vertical layout for Get Listed - append to next available column
             try:
-                all_values = sheet.get_all_values()
-                next_col = 1  # Start at column A
-                if all_values and len(all_values) > 0:
-                    first_row = all_values[0]
-                    filled_cols = len([cell for cell in first_row if cell.strip()])
-                    next_col = filled_cols + 1
+                next_col = get_next_free_column(sheet)
                 
                 if extra_data:
-                    fields = [
-                        ('Timestamp', timestamp),
-                        ('Founder Email', extra_data.get('founder_email', '')),
-                        ('Project Email', extra_data.get('project_email', '')),
-                        ('Project Name Short', extra_data.get('project_name_short', '')),
-                        ('Project Category', extra_data.get('project_category', '')),
-                        ('Project Description', extra_data.get('project_desc_long', '')),
-                        ('Token Name', extra_data.get('token_name', '')),
-                        ('Token Ticker', extra_data.get('token_ticker', '')),
-                        ('Project Image', extra_data.get('project_image', '')),
-                        ('Token Image', extra_data.get('token_image', '')),
-                        ('Minimum Raise', extra_data.get('min_raise', '')),
-                        ('Monthly Budget', extra_data.get('monthly_budget', '')),
-                        ('Performance Package', extra_data.get('performance_package', '')),
-                        ('Performance Unlock Time', extra_data.get('performance_unlock_time', '')),
-                        ('Intellectual Property', extra_data.get('intellectual_property', '')),
-                        ('Domain', extra_data.get('domain', '')),
-                        ('Discord', extra_data.get('discord', '')),
-                        ('Telegram', extra_data.get('telegram', '')),
-                        ('Docs', extra_data.get('docs', '')),
-                        ('X/Twitter', extra_data.get('x_twitter', '')),
-                        ('GitHub', extra_data.get('github', '')),
-                        ('YouTube', extra_data.get('youtube', '')),
-                        ('Medium', extra_data.get('medium', '')),
-                        ('Calendly', extra_data.get('calendly', '')),
-                        ('Insider Payout Address', extra_data.get('insider_payout_address', '')),
-                        ('Spending Limit Addresses', extra_data.get('spending_limit_addresses', '')),
-                        ('X Article', extra_data.get('x_article', '')),
-                        ('Founders Socials', extra_data.get('founders_socials', '')),
-                        ('Team Background', extra_data.get('team_background', '')),
-                        ('Timeline', extra_data.get('timeline', '')),
-                        ('Recognition', extra_data.get('recognition', '')),
-                        ('Competitors Vision', extra_data.get('competitors_vision', '')),
-                        ('Misc', extra_data.get('misc', '')),
-                        ('Founder Username', extra_data.get('founder_username', '')),
-                        ('Founder ID', extra_data.get('founder_id', ''))
+                    fields = [('Timestamp', timestamp)] + [
+                        (label, extra_data.get(key, '')) for label, key in GET_LISTED_SHEET_FIELDS
                     ]
                 else:
                     fields = [
@@ -252,53 +337,431 @@ def log_request(name, email, question, category, subcategory=None, image_url=Non
                         ('Category', category)
                     ]
                 
-                # Write field names in column next_col and values in column next_col+1
-                for row_idx, (field_name, field_value) in enumerate(fields, start=1):
-                    sheet.update_cell(row_idx, next_col, field_name)
-                    sheet.update_cell(row_idx, next_col + 1, field_value)
+                # Write field names in column next_col and values in column next_col+1 as one block
+                block = [[field_name, field_value] for field_name, field_value in fields]
+                from gspread.utils import ValueInputOption, rowcol_to_a1
+                top_left = rowcol_to_a1(1, next_col)
+                bottom_right = rowcol_to_a1(len(block), next_col + 1)
+                sheet.update(
+                    values=block,
+                    range_name=f"{top_left}:{bottom_right}",
+                    value_input_option=ValueInputOption.user_entered
+                )
                 
                 logger.info(f"Request logged vertically to '{sheet_name}' sheet in columns {next_col}-{next_col+1}: {name}, {category}")
+                return True
             except Exception as e:
                 logger.error(f"Failed to log to sheet '{sheet_name}': {e}", exc_info=True)
+                handle_sheets_error(sheet_name, e)
     else:
         logger.warning(f"Could not log to Google Sheets - client not available for sheet '{sheet_name}'")
+    return False
+
+def append_sheet_rows(sheet_name, rows):
+    """Append several rows to a table sheet with a single append_rows call"""
+    sheet = get_sheets_client(sheet_name)
+    if not sheet:
+        logger.warning(f"Could not log to Google Sheets - client not available for sheet '{sheet_name}'")
+        return False
+    try:
+        sheet.append_rows(rows)
+        logger.info(f"Logged {len(rows)} request(s) to '{sheet_name}' sheet")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to append {len(rows)} row(s) to '{sheet_name}': {e}")
+        handle_sheets_error(sheet_name, e)
+        return False
+
+def build_project_view(project_query):
+    """Regenerate a vertical view tab of the Get Listed table rows whose project name contains
+    project_query, returns the number of submissions shown. The table itself is not modified."""
+    table = get_sheets_client(GET_LISTED_TABLE)
+    if not table:
+        return 0
+    from gspread.exceptions import WorksheetNotFound
+    from gspread.utils import ValueRenderOption, rowcol_to_a1
+    values = table.get_all_values(value_render_option=ValueRenderOption.unformatted)
+    if not values:
+        return 0
+    headers, rows = values[0], values[1:]
+    name_col = headers.index('Project Name Short')
+    needle = project_query.strip().lower()
+    matches = [row for row in rows if needle in str(row[name_col]).lower()]
+    if not matches:
+        logger.warning(f"No '{GET_LISTED_TABLE}' submissions match '{project_query}'")
+        return 0
+
+    # Views are disposable, so the tab is recreated at exactly the size of the block
+    spreadsheet = _get_spreadsheet()
+    title = project_sheet_title(f"View {project_query}")
+    try:
+        spreadsheet.del_worksheet(spreadsheet.worksheet(title))
+    except WorksheetNotFound:
+        pass
+    reset_sheets_session(title)
+    view = spreadsheet.add_worksheet(title=title, rows=len(headers), cols=len(matches) + 1)
+    block = [[header] + [row[i] if i < len(row) else '' for row in matches] for i, header in enumerate(headers)]
+    view.update(values=block, range_name=f"A1:{rowcol_to_a1(len(block), len(matches) + 1)}")
+    logger.info(f"Wrote {len(matches)} submission(s) for '{project_query}' to view '{title}'")
+    return len(matches)
+
+# Write-behind Sheets logging - handlers enqueue a Submission and return straight away,
+# a background thread drains the queue and does the (blocking) gspread calls
+SHEETS_BATCH_SIZE = int(os.environ.get('SHEETS_BATCH_SIZE', 20))
+SHEETS_BATCH_WINDOW = float(os.environ.get('SHEETS_BATCH_WINDOW', 0.2))
+SHEETS_MAX_RETRIES = int(os.environ.get('SHEETS_MAX_RETRIES', 4))
+SHEETS_RETRY_BASE_DELAY = float(os.environ.get('SHEETS_RETRY_BASE_DELAY', 1.0))
+SHEETS_FLUSH_TIMEOUT = float(os.environ.get('SHEETS_FLUSH_TIMEOUT', 20))
+
+@dataclass
+class Submission:
+    category: str
+    name: str
+    email: str
+    question: Optional[str] = None
+    subcategory: Optional[str] = None
+    image_url: Optional[str] = None
+    extra_data: Optional[dict] = None
+    support_message: Optional[str] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def idempotency_key(self, user_id):
+        """Same user, flow and answers give the same key - the outbox treats a repeat within
+        SUBMISSION_DEDUP_WINDOW as a duplicate and a later one as a new submission"""
+        content = [self.name, self.email, self.question, self.subcategory, self.image_url, self.extra_data]
+        digest = hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        return f"{user_id}:{self.category.lower().replace(' ', '_')}:{digest[:32]}"
+
+    def table_name(self):
+        """Sheet this submission is appended to as a single row, None for a per-project tab"""
+        if self.category == 'Support Request':
+            return SUPPORT_TABLE
+        if self.category == 'Get Listed' and GET_LISTED_STORAGE == 'table':
+            return GET_LISTED_TABLE
+        return None
 
-async def forward_to_support(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if SUPPORT_CHAT_ID:
-        user = update.effective_user
-        username = user.username if user.username else 'no username'
-        chat_type = 'Group' if update.effective_chat.type != 'private' else 'Private'
-        message_text = (
-            f"New support request from {context.user_data.get('name')} ({username}):\n"
-            f"Email: {context.user_data.get('email')}\n"
-            f"Question: {context.user_data.get('question')}\n"
-            f"Subcategory: {context.user_data.get('subcategory', 'N/A')}\n"
-            f"Category: {context.user_data.get('category', 'General')}\n"
-            f"Image URL: {context.user_data.get('image_url', 'N/A')}\n"
-            f"User ID: {user.id}\n"
-            f"Chat Type: {chat_type}"
+    def table_row(self):
+        if self.category == 'Support Request':
+            return [self.timestamp, self.name, self.email, self.question, self.category, self.subcategory or '', self.image_url or '']
+        return [self.id, self.timestamp] + [self.extra_data.get(key, '') for _, key in GET_LISTED_SHEET_FIELDS]
+
+    def write(self):
+        table = self.table_name()
+        if table:
+            return append_sheet_rows(table, [self.table_row()])
+        return log_request(
+            self.name, self.email, self.question, self.category,
+            subcategory=self.subcategory, image_url=self.image_url,
+            extra_data=self.extra_data, timestamp=self.timestamp
         )
+
+_sheets_queue = queue.Queue()
+_sheets_worker = None
+_sheets_worker_lock = threading.Lock()
+
+def _retry_with_backoff(write, description):
+    for attempt in range(SHEETS_MAX_RETRIES + 1):
+        if write():
+            return True
+        if attempt < SHEETS_MAX_RETRIES:
+            delay = SHEETS_RETRY_BASE_DELAY * (2 ** attempt)
+            logger.warning(f"Retrying {description} in {delay:.1f}s (attempt {attempt + 1} of {SHEETS_MAX_RETRIES})")
+            time.sleep(delay)
+    logger.error(f"Giving up on {description} after {SHEETS_MAX_RETRIES + 1} attempts")
+    return False
+
+def _drain_sheets_batch():
+    """Block for the next submission, then collect whatever arrives within the batch window"""
+    batch = [_sheets_queue.get()]
+    deadline = time.monotonic() + SHEETS_BATCH_WINDOW
+    while len(batch) < SHEETS_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
         try:
-            await context.bot.send_message(chat_id=SUPPORT_CHAT_ID, text=message_text)
+            batch.append(_sheets_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+def _sheets_worker_loop():
+    while True:
+        batch = _drain_sheets_batch()
+        try:
+            # A replay may have written an entry while it sat in the queue
+            written = outbox_sheets_done([s.id for s in batch])
+            tables = {}
+            for submission in batch:
+                if submission.id not in written:
+                    tables.setdefault(submission.table_name(), []).append(submission)
+            for table, submissions in tables.items():
+                if table is None:
+                    for submission in submissions:
+                        if _retry_with_backoff(submission.write, f"'{submission.category}' submission from {submission.name}"):
+                            outbox_mark_done([submission.id], 'sheets_done')
+                    continue
+                # Everything bound for the same table goes out in one append_rows call
+                rows = [s.table_row() for s in submissions]
+                if _retry_with_backoff(lambda: append_sheet_rows(table, rows), f"{len(rows)} row(s) for '{table}'"):
+                    outbox_mark_done([s.id for s in submissions], 'sheets_done')
         except Exception as e:
-            logger.error(f"Failed to forward support request to chat {SUPPORT_CHAT_ID}: {e}")
+            logger.error(f"Sheets worker failed on a batch of {len(batch)}: {e}", exc_info=True)
+        finally:
+            for _ in batch:
+                _sheets_queue.task_done()
+
+def enqueue_submission(submission: Submission):
+    """Queue a submission for the background Sheets writer"""
+    global _sheets_worker
+    if not GOOGLE_CREDENTIALS:
+        # Missing configuration is not transient - retrying would only hold up flush_submissions
+        logger.warning(f"Sheets logging disabled, not writing '{submission.category}' submission from {submission.name}")
+        return
+    with _sheets_worker_lock:
+        if _sheets_worker is None or not _sheets_worker.is_alive():
+            _sheets_worker = threading.Thread(target=_sheets_worker_loop, name='sheets-writer', daemon=True)
+            _sheets_worker.start()
+    _sheets_queue.put(submission)
+
+def flush_submissions(timeout=SHEETS_FLUSH_TIMEOUT):
+    """Wait until queued submissions are written, returns False if the timeout is hit first"""
+    deadline = time.monotonic() + timeout
+    with _sheets_queue.all_tasks_done:
+        while _sheets_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"Sheets flush timed out with {_sheets_queue.unfinished_tasks} submission(s) pending")
+                return False
+            _sheets_queue.all_tasks_done.wait(remaining)
+    return True
+
+# Local durable store - a SQLite file shared by everything that must survive a frozen or
+# killed instance. Point LOCAL_STORE_PATH at a persistent volume on self-hosted deployments.
+LOCAL_STORE_PATH = os.environ.get('LOCAL_STORE_PATH', '/tmp/metadao_bot.sqlite3')
+OUTBOX_LEASE = float(os.environ.get('OUTBOX_LEASE', 300))
+OUTBOX_REPLAY_INTERVAL = float(os.environ.get('OUTBOX_REPLAY_INTERVAL', 60))
+OUTBOX_REPLAY_LIMIT = int(os.environ.get('OUTBOX_REPLAY_LIMIT', 20))
+OUTBOX_RETENTION = float(os.environ.get('OUTBOX_RETENTION', 7 * 24 * 3600))
+# Seconds within which the same user, flow and answers count as a retry or double tap
+SUBMISSION_DEDUP_WINDOW = float(os.environ.get('SUBMISSION_DEDUP_WINDOW', 600))
+
+_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    lease_until REAL NOT NULL,
+    sheets_done INTEGER NOT NULL DEFAULT 0,
+    support_done INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (sheets_done, support_done, lease_until);
+CREATE TABLE IF NOT EXISTS user_data (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chat_data (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen_updates (
+    update_id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS conversations (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (name, key)
+);
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_store_conn = None
+_store_lock = threading.RLock()
+_last_outbox_replay = 0.0
+
+def store_execute(sql, params=(), many=False):
+    """Run a statement on the local store (autocommit), returns all fetched rows"""
+    global _store_conn
+    with _store_lock:
+        if _store_conn is None:
+            conn = sqlite3.connect(LOCAL_STORE_PATH, check_same_thread=False, isolation_level=None, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_STORE_SCHEMA)
+            _store_conn = conn
+            logger.info(f"Opened local store at {LOCAL_STORE_PATH}")
+        if many:
+            return _store_conn.executemany(sql, params).fetchall()
+        return _store_conn.execute(sql, params).fetchall()
+
+def store_get(key, default=None):
+    rows = store_execute('SELECT value FROM kv WHERE key = ?', (key,))
+    return json.loads(rows[0]['value']) if rows else default
+
+def store_set(key, value):
+    store_execute('INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)', (key, json.dumps(value)))
+
+def outbox_put(submission: Submission):
+    """Commit a submission to the local outbox - it is durable once this returns.
+    Returns False when an entry with the same id was stored within SUBMISSION_DEDUP_WINDOW;
+    an older entry is replaced, so the repeat is delivered again."""
+    now = time.time()
+    with _store_lock:
+        store_execute(
+            'INSERT INTO outbox (id, kind, payload, created_at, lease_until, sheets_done, support_done) VALUES (?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (id) DO UPDATE SET kind = excluded.kind, payload = excluded.payload, '
+            'created_at = excluded.created_at, lease_until = excluded.lease_until, sheets_done = excluded.sheets_done, '
+            'support_done = excluded.support_done, attempts = 0 WHERE outbox.created_at < ?',
+            (
+                submission.id,
+                submission.category,
+                json.dumps(asdict(submission)),
+                now,
+                now + OUTBOX_LEASE,
+                0 if GOOGLE_CREDENTIALS else 1,  # Nothing to replay while Sheets logging is disabled
+                0 if submission.support_message and SUPPORT_CHAT_ID else 1,
+                now - SUBMISSION_DEDUP_WINDOW,
+            )
+        )
+        return store_execute('SELECT changes()')[0][0] == 1
 
-async def get_ai_response(user_message: str) -> str:
-    """Generate AI response using Groq"""
-    if not groq_client:
-        return "I'm sorry, AI responses are currently unavailable. Please use the menu buttons to navigate or submit a support request."
-    
+def outbox_mark_done(submission_ids, column):
+    if column not in ('sheets_done', 'support_done'):
+        raise ValueError(f"Unknown outbox column: {column}")
     try:
-        # Build context with all available resources
-        resources_context = "Available MetaDAO resources:\n"
-        for key, url in RESOURCE_LINKS.items():
-            resources_context += f"- {key}: {url}\n"
-        
-        system_prompt = f"""You are a helpful MetaDAO assistant bot. Your ONLY role is to answer questions about MetaDAO and related topics.
+        store_execute(f'UPDATE outbox SET {column} = 1 WHERE id = ?', [(i,) for i in submission_ids], many=True)
+    except Exception as e:
+        logger.error(f"Failed to mark {len(submission_ids)} outbox entry(s) as {column}: {e}")
+
+def outbox_claim_pending(limit=OUTBOX_REPLAY_LIMIT):
+    """Lease undelivered entries whose previous lease expired, so only one worker replays each"""
+    now = time.time()
+    with _store_lock:
+        rows = store_execute(
+            'SELECT * FROM outbox WHERE (sheets_done = 0 OR support_done = 0) AND lease_until < ? '
+            'ORDER BY created_at LIMIT ?',
+            (now, limit)
+        )
+        store_execute(
+            'UPDATE outbox SET lease_until = ?, attempts = attempts + 1 WHERE id = ?',
+            [(now + OUTBOX_LEASE, row['id']) for row in rows],
+            many=True
+        )
+    return rows
+
+def outbox_prune(retention=OUTBOX_RETENTION):
+    """Delete fully delivered entries older than retention seconds, returns how many were removed.
+    Entries still inside SUBMISSION_DEDUP_WINDOW are kept so repeats are recognized."""
+    with _store_lock:
+        store_execute(
+            'DELETE FROM outbox WHERE sheets_done = 1 AND support_done = 1 AND created_at < ?',
+            (time.time() - max(retention, SUBMISSION_DEDUP_WINDOW),)
+        )
+        return store_execute('SELECT changes()')[0][0]
+
+def outbox_sheets_done(submission_ids):
+    """Ids among submission_ids whose Sheets write already completed"""
+    if not submission_ids:
+        return set()
+    try:
+        rows = store_execute(
+            f"SELECT id FROM outbox WHERE sheets_done = 1 AND id IN ({', '.join('?' * len(submission_ids))})",
+            list(submission_ids)
+        )
+    except Exception as e:
+        logger.error(f"Failed to check {len(submission_ids)} outbox entry(s): {e}")
+        return set()
+    return {row['id'] for row in rows}
+
+def record_submission(submission: Submission):
+    """Persist a submission locally, then hand it to the background Sheets writer.
+
+    Returns False, and writes nothing, when the same submission was recorded within
+    SUBMISSION_DEDUP_WINDOW - a retried webhook or a double-tapped final step produces the same
+    idempotency key. When the local store fails the submission is still queued for Sheets, just
+    without the replay safety net.
+    """
+    try:
+        if not outbox_put(submission):
+            logger.info(f"Submission {submission.id} was already recorded, skipping")
+            return False
+    except Exception as e:
+        logger.error(f"Failed to store submission {submission.id} in the outbox, queueing it anyway: {e}", exc_info=True)
+    enqueue_submission(submission)
+    return True
+
+async def send_support_message(bot, submission: Submission):
+    """Forward a stored support message to SUPPORT_CHAT_ID, returns True once delivered"""
+    if not SUPPORT_CHAT_ID or not submission.support_message:
+        return True
+    try:
+        await bot.send_message(chat_id=SUPPORT_CHAT_ID, text=submission.support_message)
+    except Exception as e:
+        logger.error(f"Failed to forward support request to chat {SUPPORT_CHAT_ID}: {e}")
+        return False
+    outbox_mark_done([submission.id], 'support_done')
+    return True
+
+async def replay_outbox(bot, limit=OUTBOX_REPLAY_LIMIT):
+    """Deliver outbox entries whose Sheets write or support forward never completed"""
+    delivered = 0
+    for row in await asyncio.to_thread(outbox_claim_pending, limit):
+        submission = Submission(**json.loads(row['payload']))
+        logger.info(f"Replaying outbox entry {row['id']} ({row['kind']}, attempt {row['attempts'] + 1})")
+        sheets_done = bool(row['sheets_done'])
+        if not sheets_done:
+            sheets_done = await asyncio.to_thread(submission.write)
+            if sheets_done:
+                outbox_mark_done([submission.id], 'sheets_done')
+        support_done = bool(row['support_done']) or await send_support_message(bot, submission)
+        if sheets_done and support_done:
+            delivered += 1
+    return delivered
+
+async def maybe_replay_outbox(bot):
+    """Replay stale outbox entries at most once per OUTBOX_REPLAY_INTERVAL on this instance"""
+    global _last_outbox_replay
+    if time.monotonic() - _last_outbox_replay < OUTBOX_REPLAY_INTERVAL:
+        return
+    _last_outbox_replay = time.monotonic()
+    try:
+        delivered = await replay_outbox(bot)
+        if delivered:
+            logger.info(f"Replayed {delivered} pending outbox entry(s)")
+        pruned = await asyncio.to_thread(outbox_prune)
+        if pruned:
+            logger.info(f"Pruned {pruned} delivered outbox entry(s)")
+    except Exception as e:
+        logger.error(f"Outbox replay failed: {e}", exc_info=True)
+
+def build_support_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user
+    username = user.username if user.username else 'no username'
+    chat_type = 'Group' if update.effective_chat.type != 'private' else 'Private'
+    return (
+        f"New support request from {context.user_data.get('name')} ({username}):\n"
+        f"Email: {context.user_data.get('email')}\n"
+        f"Question: {context.user_data.get('question')}\n"
+        f"Subcategory: {context.user_data.get('subcategory', 'N/A')}\n"
+        f"Category: {context.user_data.get('category', 'General')}\n"
+        f"Image URL: {context.user_data.get('image_url', 'N/A')}\n"
+        f"User ID: {user.id}\n"
+        f"Chat Type: {chat_type}"
+    )
+
+SYSTEM_PROMPT_TEMPLATE = """You are a helpful MetaDAO assistant bot. Your ONLY role is to answer questions about MetaDAO and related topics.
 
 {resources_context}
 
-META Contract Address: {META_CA}
+META Contract Address: {meta_ca}
+
+{projects_context}
 
 Key information:
 - MetaDAO is a futarchy-based governance platform on Solana
@@ -324,21 +787,668 @@ Respond with: "I'm specifically designed to help with MetaDAO-related questions
 
 Keep responses under 300 words."""
 
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message}
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            max_tokens=500
+# Rendered system prompt, built on first use and reused until invalidate_system_prompt()
+_system_prompt_cache = {'messages': None, 'tokens': 0}
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token for English text)"""
+    return (len(text) + 3) // 4
+
+def render_system_prompt():
+    resources_context = "Available MetaDAO resources:\n" + "".join(
+        f"- {key}: {url}\n" for key, url in RESOURCE_LINKS.items()
+    )
+    projects_context = "Known project info:\n" + "".join(
+        f"- {project}: " + "; ".join(f"{field_name}: {value}" for field_name, value in info.items()) + "\n"
+        for project, info in PROJECT_INFO.items()
+    )
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        resources_context=resources_context,
+        meta_ca=META_CA,
+        projects_context=projects_context
+    )
+
+def get_system_messages():
+    """Immutable message prefix (the system prompt) shared by every AI request"""
+    if _system_prompt_cache['messages'] is None:
+        prompt = render_system_prompt()
+        _system_prompt_cache['messages'] = ({"role": "system", "content": prompt},)
+        _system_prompt_cache['tokens'] = estimate_tokens(prompt)
+        logger.info(f"Rendered system prompt: {len(prompt)} chars, ~{_system_prompt_cache['tokens']} tokens")
+    return _system_prompt_cache['messages']
+
+def get_system_prompt_tokens():
+    get_system_messages()
+    return _system_prompt_cache['tokens']
+
+def invalidate_system_prompt():
+    """Call after RESOURCE_LINKS, PROJECT_INFO or META_CA change so the prompt is re-rendered"""
+    _system_prompt_cache['messages'] = None
+    _system_prompt_cache['tokens'] = 0
+    # Cached answers and intent templates were built from the old tables
+    answer_cache.purge()
+    global _intent_router
+    _intent_router = None
+
+# Answer cache in front of the LLM, keyed on a normalized form of the question
+AI_CACHE_MAX_ENTRIES = int(os.environ.get('AI_CACHE_MAX_ENTRIES', 512))
+AI_CACHE_TTL = float(os.environ.get('AI_CACHE_TTL', 6 * 3600))
+AI_CACHE_SIMILARITY = float(os.environ.get('AI_CACHE_SIMILARITY', 0.8))  # 0 disables near-duplicate matching
+
+QUESTION_STOPWORDS = frozenset(
+    "a an the is are was were be been am i me my we our you your it its this that "
+    "there please pls tell about of to in on for with and or at by from hey hi hello".split()
+)
+# Question and modal words change what is asked ("should I invest" vs "can I invest"), so they
+# stay in the cache key - only docs retrieval drops them
+QUESTION_MODIFIERS = frozenset("do does did what whats how can could would should will".split())
+_question_punctuation = re.compile(r"[^\w\s]")
+
+def normalize_question(text):
+    """Lowercase, drop punctuation and stopwords, collapse whitespace"""
+    words = _question_punctuation.sub(' ', text.lower()).split()
+    return ' '.join(word for word in words if word not in QUESTION_STOPWORDS)
+
+def question_shingles(normalized):
+    """Word unigrams plus bigrams, so near-identical phrasings overlap heavily"""
+    words = normalized.split()
+    return frozenset(words) | frozenset(zip(words, words[1:]))
+
+class AnswerCache:
+    """LRU + TTL cache of AI answers with optional shingle-Jaccard near-duplicate lookup"""
+
+    def __init__(self, max_entries, ttl, similarity):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity = similarity
+        self._entries = OrderedDict()  # normalized question -> (answer, shingles, stored_at)
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def _live(self, key):
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[2] >= self.ttl:
+            del self._entries[key]
+            return None
+        return entry
+
+    def get(self, question):
+        key = normalize_question(question)
+        if not key:
+            return None
+        entry = self._live(key)
+        if entry is None and self.similarity > 0:
+            shingles = question_shingles(key)
+            best, best_score = None, self.similarity
+            for other_key, (_, other_shingles, _) in list(self._entries.items()):
+                score = len(shingles & other_shingles) / len(shingles | other_shingles)
+                if score >= best_score and self._live(other_key):
+                    best, best_score = other_key, score
+            if best is not None:
+                key, entry = best, self._entries[best]
+                self.near_hits += 1
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, question, answer):
+        key = normalize_question(question)
+        if not key:
+            return
+        self._entries[key] = (answer, question_shingles(key), time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def purge(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'near_hits': self.near_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+answer_cache = AnswerCache(AI_CACHE_MAX_ENTRIES, AI_CACHE_TTL, AI_CACHE_SIMILARITY)
+
+# Offline retrieval over a local docs.metadao.fi snapshot. `build-docs-index` turns the
+# snapshot into a BM25 index file; queries mmap it and read only the postings they need.
+DOCS_SNAPSHOT_DIR = os.environ.get('DOCS_SNAPSHOT_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs_snapshot'))
+DOCS_INDEX_PATH = os.environ.get('DOCS_INDEX_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'docs_index.bin'))
+DOCS_BASE_URL = os.environ.get('DOCS_BASE_URL', 'https://docs.metadao.fi/')
+DOCS_TOP_K = int(os.environ.get('DOCS_TOP_K', 3))
+DOCS_CONTEXT_MAX_TOKENS = int(os.environ.get('DOCS_CONTEXT_MAX_TOKENS', 600))
+DOCS_PASSAGE_CHARS = 800
+DOCS_INDEX_MAGIC = b'MDIX1\0'
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_docs_word = re.compile(r"[a-z0-9]+")
+_html_drop = re.compile(r"<(script|style|nav|footer)\b.*?</\1>", re.S | re.I)
+_html_block = re.compile(r"</?(p|div|h[1-6]|li|ul|ol|section|article|br|tr|pre)\b[^>]*>", re.I)
+_html_tag = re.compile(r"<[^>]+>")
+
+def docs_terms(text):
+    return [word for word in _docs_word.findall(text.lower()) if word not in QUESTION_STOPWORDS and word not in QUESTION_MODIFIERS]
+
+def _snapshot_text(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    if path.endswith(('.html', '.htm')):
+        text = _html_drop.sub(' ', text)
+        text = _html_block.sub('\n\n', text)
+        text = html.unescape(_html_tag.sub(' ', text))
+    return text
+
+def _snapshot_url(relpath):
+    page = os.path.splitext(relpath)[0].replace(os.sep, '/')
+    if page == 'index' or page.endswith('/index'):
+        page = page[:-len('index')]
+    return DOCS_BASE_URL + page
+
+def _split_passages(text):
+    """Group paragraphs into passages of up to DOCS_PASSAGE_CHARS, starting a new one at each heading"""
+    passages, current, heading = [], '', ''
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = ' '.join(paragraph.split())
+        if not paragraph:
+            continue
+        if paragraph.startswith('#'):
+            if current:
+                passages.append(current)
+            heading = paragraph.lstrip('# ') + ':'
+            current = heading
+            continue
+        if current and len(current) + len(paragraph) > DOCS_PASSAGE_CHARS:
+            passages.append(current)
+            current = heading
+        current = f"{current} {paragraph}".strip()
+    if current and current != heading:
+        passages.append(current)
+    return passages
+
+def build_docs_index(snapshot_dir=DOCS_SNAPSHOT_DIR, output_path=DOCS_INDEX_PATH):
+    """Ingest .md/.txt/.html pages under snapshot_dir into a compact BM25 index file"""
+    passages = []  # (source url, text)
+    for root, _, files in os.walk(snapshot_dir):
+        for name in sorted(files):
+            if not name.endswith(('.md', '.txt', '.html', '.htm')):
+                continue
+            path = os.path.join(root, name)
+            url = _snapshot_url(os.path.relpath(path, snapshot_dir))
+            passages.extend((url, text) for text in _split_passages(_snapshot_text(path)))
+    if not passages:
+        raise ValueError(f"No .md/.txt/.html pages found under {snapshot_dir}")
+
+    postings = {}  # term -> [(passage id, term frequency)]
+    lengths = []
+    for passage_id, (_, text) in enumerate(passages):
+        terms = docs_terms(text)
+        lengths.append(len(terms))
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append((passage_id, tf))
+
+    postings_blob = array('I')
+    term_table = {}
+    for term in sorted(postings):
+        term_table[term] = (len(postings_blob) // 2, len(postings[term]))
+        for passage_id, tf in postings[term]:
+            postings_blob.extend((passage_id, tf))
+
+    text_blob = bytearray()
+    passage_table = []
+    for (url, text), length in zip(passages, lengths):
+        encoded = text.encode('utf-8')
+        passage_table.append((len(text_blob), len(encoded), length, url))
+        text_blob.extend(encoded)
+
+    header = json.dumps({
+        'avgdl': sum(lengths) / len(lengths),
+        'terms': term_table,
+        'passages': passage_table,
+        'postings_bytes': len(postings_blob) * postings_blob.itemsize,
+    }, separators=(',', ':')).encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(DOCS_INDEX_MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        f.write(postings_blob.tobytes())
+        f.write(text_blob)
+    logger.info(f"Built docs index {output_path}: {len(passages)} passages, {len(term_table)} terms")
+    return len(passages)
+
+class DocsIndex:
+    """Read-only view over a memory-mapped BM25 index built by build_docs_index()"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(DOCS_INDEX_MAGIC)] != DOCS_INDEX_MAGIC:
+            raise ValueError(f"{path} is not a docs index")
+        offset = len(DOCS_INDEX_MAGIC)
+        (header_len,) = struct.unpack_from('<I', self._mmap, offset)
+        offset += 4
+        header = json.loads(self._mmap[offset:offset + header_len])
+        offset += header_len
+        self.avgdl = header['avgdl']
+        self.terms = header['terms']
+        self.passages = header['passages']
+        self._postings = memoryview(self._mmap)[offset:offset + header['postings_bytes']].cast('I')
+        self._text_offset = offset + header['postings_bytes']
+
+    def passage_text(self, passage_id):
+        start, length, _, _ = self.passages[passage_id]
+        start += self._text_offset
+        return self._mmap[start:start + length].decode('utf-8')
+
+    def search(self, query, k=DOCS_TOP_K):
+        """Top-k (score, source url, text) passages for the query by BM25"""
+        n = len(self.passages)
+        scores = {}
+        for term in set(docs_terms(query)):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            start, df = entry
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for i in range(start * 2, (start + df) * 2, 2):
+                passage_id, tf = self._postings[i], self._postings[i + 1]
+                norm = 1 - BM25_B + BM25_B * self.passages[passage_id][2] / self.avgdl
+                scores[passage_id] = scores.get(passage_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(score, self.passages[pid][3], self.passage_text(pid)) for pid, score in best]
+
+_docs_index = None
+_docs_index_checked = False
+
+def get_docs_index():
+    """The instance's docs index, or None when no index file is deployed"""
+    global _docs_index, _docs_index_checked
+    if not _docs_index_checked:
+        _docs_index_checked = True
+        if os.path.exists(DOCS_INDEX_PATH):
+            try:
+                _docs_index = DocsIndex(DOCS_INDEX_PATH)
+                logger.info(f"Loaded docs index with {len(_docs_index.passages)} passages")
+            except Exception as e:
+                logger.error(f"Failed to load docs index {DOCS_INDEX_PATH}: {e}")
+        else:
+            logger.info(f"No docs index at {DOCS_INDEX_PATH}, answering without retrieval")
+    return _docs_index
+
+def retrieve_docs_context(question):
+    """Documentation excerpts for the question, kept under DOCS_CONTEXT_MAX_TOKENS"""
+    index = get_docs_index()
+    if index is None:
+        return None
+    excerpts, budget = [], DOCS_CONTEXT_MAX_TOKENS
+    for _, url, text in index.search(question):
+        excerpt = f"[{url}]\n{text}"
+        cost = estimate_tokens(excerpt)
+        if cost > budget:
+            break
+        excerpts.append(excerpt)
+        budget -= cost
+    if not excerpts:
+        return None
+    return "Relevant documentation excerpts (prefer these over general knowledge):\n\n" + "\n\n".join(excerpts)
+
+# Deterministic fast path for questions the link/CA/project tables already answer.
+# Aliases are compiled into one Aho-Corasick automaton and matched in a single pass.
+INTENT_MAX_WORDS = int(os.environ.get('INTENT_MAX_WORDS', 8))
+
+LINK_ALIASES = {
+    'docs': ('docs', 'documentation', 'doc', 'gitbook'),
+    'website': ('website', 'homepage'),
+    'markets': ('markets', 'market', 'proposal markets'),
+    'icos': ('icos', 'ico calendar', 'calendar', 'upcoming icos'),
+    'get_listed': ('get listed', 'listing', 'list my project'),
+    'twitter': ('twitter', 'x account', 'x profile'),
+    'telegram': ('telegram', 'tg', 'telegram group'),
+    'discord': ('discord',),
+    'youtube': ('youtube', 'yt'),
+    'blog': ('blog',),
+    'github': ('github', 'repo', 'source code'),
+    'futarchyamm': ('futarchy amm', 'amm metrics', 'dune'),
+}
+LINK_LABELS = {
+    'docs': '📚 MetaDAO Documentation',
+    'website': '🌐 MetaDAO Website',
+    'markets': '📊 MetaDAO Markets',
+    'icos': '📅 MetaDAO Calendar & ICOs',
+    'get_listed': '🚀 How to Get Listed',
+    'twitter': '🐦 MetaDAO on X (Twitter)',
+    'telegram': '💬 MetaDAO on Telegram',
+    'discord': '💬 MetaDAO on Discord',
+    'youtube': '📺 MetaDAO on YouTube',
+    'blog': '📝 MetaDAO Blog',
+    'github': '💻 MetaDAO on GitHub',
+    'futarchyamm': '📊 Futarchy AMM Metrics',
+}
+ATTRIBUTE_ALIASES = {
+    'ca': ('ca', 'contract address', 'contract', 'token address', 'mint', 'mint address', 'address'),
+    'max_supply': ('max supply', 'maximum supply', 'total supply', 'supply'),
+    'min_target': ('min target', 'minimum target', 'min raise', 'minimum raise'),
+    'max_target': ('max target', 'maximum target', 'max raise', 'maximum raise', 'cap'),
+    'tokenomics': ('tokenomics',),
+}
+ATTRIBUTE_LABELS = {
+    'ca': 'Contract Address',
+    'max_supply': 'Max Supply',
+    'min_target': 'Minimum Target',
+    'max_target': 'Maximum Target',
+    'tokenomics': 'Tokenomics',
+}
+# Every project the bot knows by name - a question naming one without a PROJECT_INFO entry goes
+# to the LLM instead of defaulting to META
+INTENT_PROJECTS = ('meta', 'umbra', 'avici', 'paystream', 'loyal', 'zklsol', 'evora', 'aurum')
+PROJECT_ALIASES = {'meta': ('meta', 'metadao')}
+# Words that may surround an attribute without naming a token; anything else left over could be
+# an unknown token ("usdc mint address"), so the question is not answered with META's entry
+INTENT_FILLER_WORDS = frozenset(
+    "s whats where which token tokens coin official correct real right current give send share "
+    "get need know want find pls plz bot".split()
+)
+# Same for links - "the website is broken" is a support question, not a request for the URL
+LINK_FILLER_WORDS = frozenset("link links url urls site page official open visit go check".split())
+# Questions asking for an explanation go to the LLM even when they mention a table entry
+EXPLANATION_CUES = frozenset(('how', 'why', 'explain', 'difference', 'work', 'works', 'mean', 'means', 'when', 'should'))
+
+class AhoCorasick:
+    """Multi-pattern matcher that reports whole-word matches in one pass over the text"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for pattern, value in patterns:
+            node = 0
+            for char in pattern:
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            self._out[node].append((len(pattern), value))
+        # Breadth-first pass so every fail link points at an already finished node;
+        # depth-1 nodes keep failing to the root
+        frontier = list(self._goto[0].values())
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for char, child in self._goto[node].items():
+                    fail = self._fail[node]
+                    while fail and char not in self._goto[fail]:
+                        fail = self._fail[fail]
+                    self._fail[child] = self._goto[fail].get(char, 0)
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+                    next_frontier.append(child)
+            frontier = next_frontier
+
+    def find(self, text):
+        matches = []
+        node = 0
+        for end, char in enumerate(text, start=1):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, value in self._out[node]:
+                start = end - length
+                if (start == 0 or text[start - 1] == ' ') and (end == len(text) or text[end] == ' '):
+                    matches.append(value)
+        return matches
+
+class IntentRouter:
+    """Answers link, CA and project-fact questions from templates without calling the LLM"""
+
+    def __init__(self):
+        patterns = []
+        for key, aliases in LINK_ALIASES.items():
+            if key in RESOURCE_LINKS:
+                patterns.extend((alias, ('link', key)) for alias in aliases)
+        for attribute, aliases in ATTRIBUTE_ALIASES.items():
+            patterns.extend((alias, ('attribute', attribute)) for alias in aliases)
+        for project in INTENT_PROJECTS:
+            patterns.extend((alias, ('project', project)) for alias in PROJECT_ALIASES.get(project, (project,)))
+        self._matcher = AhoCorasick(patterns)
+        self._attribute_words = frozenset(
+            word for aliases in ATTRIBUTE_ALIASES.values() for alias in aliases for word in alias.split()
         )
-        
-        return chat_completion.choices[0].message.content
+        self._link_words = LINK_FILLER_WORDS | frozenset(
+            word for aliases in LINK_ALIASES.values() for alias in aliases for word in alias.split()
+        )
+        self.total = 0
+        self.deflected = 0
+
+    def deflection_rate(self):
+        return self.deflected / self.total if self.total else 0.0
+
+    def _answer(self, text):
+        words = text.split()
+        if not words or len(words) > INTENT_MAX_WORDS or EXPLANATION_CUES.intersection(words):
+            return None
+        found = {'link': set(), 'attribute': set(), 'project': set()}
+        for kind, value in self._matcher.find(text):
+            found[kind].add(value)
+        projects, attributes, links = found['project'], found['attribute'], found['link']
+
+        if len(attributes) == 1 and len(projects) <= 1:
+            attribute = next(iter(attributes))
+            if not projects and self._has_other_words(words, self._attribute_words):
+                return None
+            project = next(iter(projects)) if projects else 'meta'
+            if attribute == 'ca' and project == 'meta':
+                return f"🪙 *META Contract Address*\n\n`{META_CA}`\n\n💡 Tap to copy"
+            value = PROJECT_INFO.get(project, {}).get(attribute)
+            if value is None:
+                return None
+            if attribute == 'ca' and not value.startswith('TBA'):
+                value = f"`{value}`"
+            return f"📊 *{project.capitalize()} - {ATTRIBUTE_LABELS[attribute]}*\n\n{value}"
+        if not attributes and not projects and len(links) == 1 and not self._has_other_words(words, self._link_words):
+            key = next(iter(links))
+            return f"*{LINK_LABELS[key]}*\n\n{RESOURCE_LINKS[key]}"
+        return None
+
+    def _has_other_words(self, words, known_words):
+        """True when some word is neither in known_words nor filler, e.g. a token we don't know or
+        a complaint about a link"""
+        return any(
+            word not in known_words and word not in INTENT_FILLER_WORDS
+            and word not in QUESTION_STOPWORDS and word not in QUESTION_MODIFIERS
+            for word in words
+        )
+
+    def route(self, question):
+        """Template answer for the question, or None if it should go to the LLM"""
+        self.total += 1
+        answer = self._answer(_question_punctuation.sub(' ', question.lower()).replace('_', ' ').strip())
+        if answer is not None:
+            self.deflected += 1
+            logger.info(f"Intent fast path answered ({self.deflected}/{self.total} deflected, {self.deflection_rate():.0%})")
+        return answer
+
+_intent_router = None
+
+def get_intent_router():
+    global _intent_router
+    if _intent_router is None:
+        _intent_router = IntentRouter()
+    return _intent_router
+
+# Rate limiting for AI questions - a token bucket per user, plus a global request budget
+# and concurrency cap so one flood cannot exhaust the Groq quota for everybody
+AI_USER_RATE = float(os.environ.get('AI_USER_RATE', 6))  # questions per minute
+AI_USER_BURST = int(os.environ.get('AI_USER_BURST', 3))
+AI_GLOBAL_RATE = float(os.environ.get('AI_GLOBAL_RATE', 30))  # Groq calls per minute
+AI_GLOBAL_BURST = int(os.environ.get('AI_GLOBAL_BURST', 10))
+AI_MAX_CONCURRENCY = int(os.environ.get('AI_MAX_CONCURRENCY', 4))
+AI_QUEUE_TIMEOUT = float(os.environ.get('AI_QUEUE_TIMEOUT', 10))
+AI_RATE_LIMIT_MAX_USERS = 10000
+
+AI_RATE_LIMITED_TEXT = "⏳ You're sending questions a bit too quickly. Please wait a moment and try again."
+AI_BUSY_TEXT = "⏳ I'm getting a lot of questions right now. Please try again in a minute, or use the menu buttons below."
+
+class TokenBucket:
+    def __init__(self, rate_per_minute, capacity):
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self):
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self):
+        """Seconds until take() can succeed"""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+class AIBusyError(Exception):
+    pass
+
+_user_buckets = OrderedDict()  # user id -> TokenBucket, least recently used first
+_global_ai_bucket = TokenBucket(AI_GLOBAL_RATE, AI_GLOBAL_BURST)
+_ai_semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+def allow_ai_question(user_id):
+    """Per-user token bucket check, False when the user is over their limit"""
+    bucket = _user_buckets.pop(user_id, None) or TokenBucket(AI_USER_RATE, AI_USER_BURST)
+    _user_buckets[user_id] = bucket
+    while len(_user_buckets) > AI_RATE_LIMIT_MAX_USERS:
+        # Idle users' buckets have refilled anyway, so dropping them is harmless
+        _user_buckets.popitem(last=False)
+    return bucket.take()
+
+@asynccontextmanager
+async def ai_call_slot():
+    """Wait (bounded by AI_QUEUE_TIMEOUT) for the global budget and a concurrency slot"""
+    deadline = time.monotonic() + AI_QUEUE_TIMEOUT
+    try:
+        await asyncio.wait_for(_ai_semaphore.acquire(), AI_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise AIBusyError("No free AI concurrency slot") from None
+    try:
+        while not _global_ai_bucket.take():
+            delay = _global_ai_bucket.wait_time()
+            if time.monotonic() + delay > deadline:
+                raise AIBusyError("Global AI request budget exhausted")
+            await asyncio.sleep(delay)
+        yield
+    finally:
+        _ai_semaphore.release()
+
+async def _complete_ai_response(user_message: str, on_partial=None) -> str:
+    messages = list(get_system_messages())
+    docs_context = retrieve_docs_context(user_message)
+    if docs_context:
+        messages.append({"role": "system", "content": docs_context})
+    messages.append({"role": "user", "content": user_message})
+    
+    stream = await get_groq_client().chat.completions.create(
+        messages=messages,
+        model="llama-3.3-70b-versatile",
+        temperature=0.7,
+        max_tokens=500,
+        stream=True
+    )
+    
+    parts = []
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        parts.append(delta)
+        if on_partial:
+            await on_partial(''.join(parts))
+    
+    if not parts:
+        raise ValueError("Empty completion from Groq")
+    return ''.join(parts)
+
+async def get_ai_response(user_message: str, on_partial=None) -> str:
+    """Generate AI response using Groq, streaming partial text to on_partial(text) if given"""
+    if not get_groq_client():
+        return "I'm sorry, AI responses are currently unavailable. Please use the menu buttons to navigate or submit a support request."
+    
+    cached = answer_cache.get(user_message)
+    if cached is not None:
+        return cached
+    
+    try:
+        return await _single_flight_completion(user_message, on_partial)
+    except AIBusyError as e:
+        logger.warning(f"AI request shed: {e}")
+        return AI_BUSY_TEXT
     except Exception as e:
         logger.error(f"Error getting AI response: {e}", exc_info=True)
         return "I'm having trouble processing your request right now. Please try again or submit a support request for assistance."
 
+# Single-flight - concurrent identical questions (same normalized form) share one completion
+_inflight_questions = {}  # normalized question -> Future of the leader's answer
+single_flight_stats = {'upstream_calls': 0, 'saved_calls': 0}
+
+class _LeaderCancelled(Exception):
+    """Set on the shared future when the leader's handler is cancelled, so a follower takes over"""
+
+async def _single_flight_completion(user_message: str, on_partial=None) -> str:
+    key = normalize_question(user_message)
+    inflight = _inflight_questions.get(key) if key else None
+    while inflight is not None:
+        single_flight_stats['saved_calls'] += 1
+        logger.info(f"Joined in-flight AI request ({single_flight_stats['saved_calls']} upstream calls saved)")
+        # Followers get the leader's answer, or the same error
+        try:
+            return await asyncio.shield(inflight)
+        except _LeaderCancelled:
+            # The first follower to wake up becomes the new leader, the rest join it
+            single_flight_stats['saved_calls'] -= 1
+            logger.info("In-flight AI request was cancelled, retrying")
+            inflight = _inflight_questions.get(key)
+
+    future = asyncio.get_running_loop().create_future()
+    # Nobody may be waiting, so mark a failure as retrieved to avoid asyncio warnings
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    if key:
+        _inflight_questions[key] = future
+    single_flight_stats['upstream_calls'] += 1
+    try:
+        async with ai_call_slot():
+            answer = await _complete_ai_response(user_message, on_partial)
+        answer_cache.put(user_message, answer)
+        future.set_result(answer)
+        return answer
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        if key and _inflight_questions.get(key) is future:
+            del _inflight_questions[key]
+
 async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if update.effective_chat.type != 'private':
         return
@@ -565,7 +1675,11 @@ async def get_name(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 async def get_email(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not context.user_data.get('support_active'):
         return ConversationHandler.END
-    context.user_data['email'] = update.message.text
+    try:
+        context.user_data['email'] = validate_email(update.message.text)
+    except ValueError as e:
+        await update.message.reply_text(f"⚠️ {e}", parse_mode='Markdown')
+        return EMAIL
     
     subcategory = context.user_data.get('subcategory', 'General Inquiry')
     
@@ -594,11 +1708,11 @@ async def get_image_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     if not context.user_data.get('support_active'):
         return ConversationHandler.END
     
-    image_url = update.message.text
-    if image_url.lower() in ['none', 'skip', 'n/a']:
-        context.user_data['image_url'] = None
-    else:
-        context.user_data['image_url'] = image_url
+    try:
+        context.user_data['image_url'] = validate_optional_url(update.message.text) or None
+    except ValueError as e:
+        await update.message.reply_text(f"⚠️ {e}\n\nOr type *none* if you don't have an image.", parse_mode='Markdown')
+        return IMAGE_URL
     
     context.user_data['category'] = 'Support Request'
     name = context.user_data['name']
@@ -607,8 +1721,14 @@ async def get_image_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     subcategory = context.user_data.get('subcategory', 'General Inquiry')
     image_url_value = context.user_data.get('image_url')
 
-    log_request(name, email, question, 'Support Request', subcategory=subcategory, image_url=image_url_value)
-    await forward_to_support(update, context)
+    submission = Submission(
+        'Support Request', name, email, question,
+        subcategory=subcategory, image_url=image_url_value,
+        support_message=build_support_message(update, context)
+    )
+    submission.id = submission.idempotency_key(update.effective_user.id)
+    if record_submission(submission):
+        await send_support_message(context.bot, submission)
 
     response = (
         "✅ *Request Submitted Successfully!*\n\n"
@@ -628,130 +1748,158 @@ async def get_image_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     context.user_data['support_active'] = False
     return ConversationHandler.END
 
-async def ca_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        f"🪙 *META Contract Address*\n\n"
-        f"`{META_CA}`\n\n"
-        "💡 Tap to copy the address above",
-        parse_mode='Markdown'
-    )
-
-async def web_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        f"🌐 *MetaDAO Website*\n\n"
-        f"Visit us at: {RESOURCE_LINKS['website']}\n\n"
-        "Explore our platform, learn about futarchy, and discover upcoming projects!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def docs_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        f"📚 *MetaDAO Documentation*\n\n"
-        f"Access our docs at: {RESOURCE_LINKS['docs']}\n\n"
-        "Find guides, tutorials, and detailed information about our platform.",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def icos_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        f"📅 *MetaDAO Calendar & ICOs*\n\n"
-        f"View all upcoming ICOs: {RESOURCE_LINKS['icos']}\n\n"
-        "Stay updated on the latest project launches and investment opportunities!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def markets_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "📊 *MetaDAO Markets*\n\n"
-        f"View active markets: {RESOURCE_LINKS['markets']}\n\n"
-        "Participate in governance by trading on proposal markets!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def twitter_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "🐦 *Follow MetaDAO on X (Twitter)*\n\n"
-        "Stay updated with the latest news and announcements:\n"
-        f"{RESOURCE_LINKS['twitter']}\n\n"
-        "Join our community and be part of the conversation!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def telegram_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "💬 *Join MetaDAO on Telegram*\n\n"
-        "Connect with our community:\n"
-        f"{RESOURCE_LINKS['telegram']}\n\n"
-        "Ask questions, share ideas, and stay updated!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def discord_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "💬 *Join MetaDAO on Discord*\n\n"
-        "Connect with our community:\n"
-        f"{RESOURCE_LINKS['discord']}\n\n"
-        "Participate in discussions and get support!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
-
-async def youtube_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "📺 *MetaDAO on YouTube*\n\n"
-        "Watch tutorials, updates, and more:\n"
-        f"{RESOURCE_LINKS['youtube']}\n\n"
-        "Subscribe to stay informed!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
+# Static replies - text commands and the group CA trigger always answer with the same message,
+# so the catalog is built once and serves both the handlers and the webhook's inline reply
+STATIC_REPLIES = {
+    'ca': {
+        'text': f"🪙 *META Contract Address*\n\n`{META_CA}`\n\n💡 Tap to copy the address above",
+    },
+    'web': {
+        'text': f"🌐 *MetaDAO Website*\n\n"
+                f"Visit us at: {RESOURCE_LINKS['website']}\n\n"
+                "Explore our platform, learn about futarchy, and discover upcoming projects!",
+        'disable_web_page_preview': True,
+    },
+    'docs': {
+        'text': f"📚 *MetaDAO Documentation*\n\n"
+                f"Access our docs at: {RESOURCE_LINKS['docs']}\n\n"
+                "Find guides, tutorials, and detailed information about our platform.",
+        'disable_web_page_preview': True,
+    },
+    'icos': {
+        'text': f"📅 *MetaDAO Calendar & ICOs*\n\n"
+                f"View all upcoming ICOs: {RESOURCE_LINKS['icos']}\n\n"
+                "Stay updated on the latest project launches and investment opportunities!",
+        'disable_web_page_preview': True,
+    },
+    'markets': {
+        'text': "📊 *MetaDAO Markets*\n\n"
+                f"View active markets: {RESOURCE_LINKS['markets']}\n\n"
+                "Participate in governance by trading on proposal markets!",
+        'disable_web_page_preview': True,
+    },
+    'twitter': {
+        'text': "🐦 *Follow MetaDAO on X (Twitter)*\n\n"
+                "Stay updated with the latest news and announcements:\n"
+                f"{RESOURCE_LINKS['twitter']}\n\n"
+                "Join our community and be part of the conversation!",
+        'disable_web_page_preview': True,
+    },
+    'telegram': {
+        'text': "💬 *Join MetaDAO on Telegram*\n\n"
+                "Connect with our community:\n"
+                f"{RESOURCE_LINKS['telegram']}\n\n"
+                "Ask questions, share ideas, and stay updated!",
+        'disable_web_page_preview': True,
+    },
+    'discord': {
+        'text': "💬 *Join MetaDAO on Discord*\n\n"
+                "Connect with our community:\n"
+                f"{RESOURCE_LINKS['discord']}\n\n"
+                "Participate in discussions and get support!",
+        'disable_web_page_preview': True,
+    },
+    'youtube': {
+        'text': "📺 *MetaDAO on YouTube*\n\n"
+                "Watch tutorials, updates, and more:\n"
+                f"{RESOURCE_LINKS['youtube']}\n\n"
+                "Subscribe to stay informed!",
+        'disable_web_page_preview': True,
+    },
+    'blog': {
+        'text': "📝 *MetaDAO Blog*\n\n"
+                "Read our latest articles and updates:\n"
+                f"{RESOURCE_LINKS['blog']}\n\n"
+                "Deep dives, announcements, and insights!",
+        'disable_web_page_preview': True,
+    },
+    'futarchyamm': {
+        'text': "📊 *Futarchy AMM Metrics*\n\n"
+                "View detailed analytics and metrics:\n"
+                f"{RESOURCE_LINKS['futarchyamm']}\n\n"
+                "Track performance and market data!",
+        'disable_web_page_preview': True,
+    },
+    'github': {
+        'text': "💻 *MetaDAO on GitHub*\n\n"
+                "Explore our open-source code:\n"
+                f"{RESOURCE_LINKS['github']}\n\n"
+                "Contribute, review, and build with us!",
+        'disable_web_page_preview': True,
+    },
+}
+CA_TRIGGER_REPLY = {
+    'text': f"🪙 *META Contract Address*\n\n`{META_CA}`\n\n💡 Tap to copy",
+    'remove_keyboard': True,
+}
+CA_TEXTS = frozenset(('CA', 'ca', 'Ca'))
+GROUP_CHAT_TYPES = ('group', 'supergroup')
+
+def static_reply_kwargs(entry):
+    """reply_text() arguments for a catalog entry"""
+    return {
+        'text': entry['text'],
+        'parse_mode': 'Markdown',
+        'disable_web_page_preview': entry.get('disable_web_page_preview'),
+        'reply_markup': ReplyKeyboardRemove() if entry.get('remove_keyboard') else None,
+    }
 
-async def blog_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "📝 *MetaDAO Blog*\n\n"
-        "Read our latest articles and updates:\n"
-        f"{RESOURCE_LINKS['blog']}\n\n"
-        "Deep dives, announcements, and insights!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
+def _static_reply_fields(entry):
+    """The same reply as raw sendMessage fields, serialized without the opening brace"""
+    fields = {'text': entry['text'], 'parse_mode': 'Markdown'}
+    if entry.get('disable_web_page_preview'):
+        fields['link_preview_options'] = {'is_disabled': True}
+    if entry.get('remove_keyboard'):
+        fields['reply_markup'] = {'remove_keyboard': True}
+    return json.dumps(fields)[1:]
 
-async def futarchyamm_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "📊 *Futarchy AMM Metrics*\n\n"
-        "View detailed analytics and metrics:\n"
-        f"{RESOURCE_LINKS['futarchyamm']}\n\n"
-        "Track performance and market data!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
+_static_command_fields = {command: _static_reply_fields(entry) for command, entry in STATIC_REPLIES.items()}
+_ca_trigger_fields = _static_reply_fields(CA_TRIGGER_REPLY)
 
-async def github_command_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text(
-        "💻 *MetaDAO on GitHub*\n\n"
-        "Explore our open-source code:\n"
-        f"{RESOURCE_LINKS['github']}\n\n"
-        "Contribute, review, and build with us!",
-        parse_mode='Markdown',
-        disable_web_page_preview=True
-    )
+def static_command_handler(command):
+    async def reply(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        await update.message.reply_text(**static_reply_kwargs(STATIC_REPLIES[command]))
+    return reply
 
 async def handle_ca(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if update.effective_chat.type == 'private':
         return
-    ca_variants = ["CA", "ca", "Ca"]
-    if update.message.text in ca_variants:
-        await update.message.reply_text(
-            f"🪙 *META Contract Address*\n\n`{META_CA}`\n\n💡 Tap to copy",
-            parse_mode='Markdown',
-            reply_markup=ReplyKeyboardRemove()
-        )
+    if update.message.text in CA_TEXTS:
+        await update.message.reply_text(**static_reply_kwargs(CA_TRIGGER_REPLY))
+
+class StreamingReply:
+    """Coalesces streamed text into throttled edits of one placeholder message"""
+
+    def __init__(self, message):
+        self.message = message
+        self.shown = ''
+        self.last_edit = 0.0
+
+    async def update(self, text):
+        # Partial text may have unbalanced Markdown, so it is shown as plain text
+        if len(text) - len(self.shown) < AI_STREAM_MIN_CHARS:
+            return
+        if time.monotonic() - self.last_edit < AI_STREAM_EDIT_INTERVAL:
+            return
+        self.last_edit = time.monotonic()
+        try:
+            await self.message.edit_text(text + ' ▌', disable_web_page_preview=True)
+            self.shown = text
+        except Exception as e:
+            logger.warning(f"Skipped streaming edit: {e}")
+
+    async def finish(self, text, reply_markup=None):
+        try:
+            await self.message.edit_text(
+                text,
+                parse_mode='Markdown',
+                reply_markup=reply_markup,
+                disable_web_page_preview=True
+            )
+        except BadRequest as e:
+            # The model occasionally produces Markdown Telegram cannot parse
+            logger.warning(f"Markdown rejected for AI reply, sending plain text: {e}")
+            await self.message.edit_text(text, reply_markup=reply_markup, disable_web_page_preview=True)
 
 async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Only handle private messages that aren't part of a conversation
@@ -762,132 +1910,175 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     if context.user_data.get('support_active') or context.user_data.get('get_listed_active'):
         return
     
-    # Get AI response
     user_message = update.message.text
-    logger.info(f"Processing AI request from user {update.effective_user.id}: {user_message}")
     
-    # Send typing indicator
-    await update.message.chat.send_action(action="typing")
+    # Link/CA/project-fact questions are answered from templates without the LLM
+    fast_answer = get_intent_router().route(user_message)
+    if fast_answer:
+        await update.message.reply_text(
+            fast_answer,
+            parse_mode='Markdown',
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]]),
+            disable_web_page_preview=True
+        )
+        return
     
-    ai_response = await get_ai_response(user_message)
+    if not allow_ai_question(update.effective_user.id):
+        logger.info(f"Rate limited AI request from user {update.effective_user.id}")
+        await update.message.reply_text(AI_RATE_LIMITED_TEXT)
+        return
     
-    await update.message.reply_text(
-        ai_response,
-        parse_mode='Markdown',
-        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]]),
-        disable_web_page_preview=True
-    )
-
-async def get_listed_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    query = update.callback_query
-    await query.answer()
+    # Get AI response
+    logger.info(f"Processing AI request from user {update.effective_user.id}: {user_message}")
     
-    keyboard = [
-        [InlineKeyboardButton("✅ Yes, let's get started!", callback_data='get_listed_yes')],
-        [InlineKeyboardButton("⬅️ Back to Main Menu", callback_data='main_menu')]
-    ]
+    # Placeholder that is progressively edited while the answer streams in
+    reply = StreamingReply(await update.message.reply_text("💭 Thinking..."))
     
-    await query.edit_message_text(
-        "🚀 *Get Your Project Listed on MetaDAO*\n\n"
-        "To get listed, you'll need to provide:\n\n"
-        "📝 *Project Information:*\n"
-        "• Project category (DeFi, DePIN, Gaming, etc.)\n"
-        "• Project name and description (short & long versions)\n"
-        "• Token name, ticker, and address\n"
-        "• Links (domain, docs, social media, GitHub, YouTube, Medium, Calendly)\n\n"
-        "🖼️ *Visual Assets:*\n"
-        "• Project image and token image\n\n"
-        "💰 *Financial Details:*\n"
-        "• Minimum raise amount\n"
-        "• Maximum spending limit\n"
-        "• Monthly team budget\n"
-        "• Performance package configuration (optional)\n"
-        "• Start and end dates\n"
-        "• Payout addresses\n\n"
-        "📜 *Additional:*\n"
-        "• Intellectual property list\n"
-        "• X article about the project\n"
-        "• Founders' socials and speeches\n"
-        "• Team background and highlights\n"
-        "• Timeline and progress stage\n"
-        "• Recognition and achievements\n"
-        "• Competitors and market vision\n\n"
-        "⏱️ *Time required:* ~15-20 minutes\n\n"
-        "Ready to begin?",
-        parse_mode='Markdown',
-        reply_markup=InlineKeyboardMarkup(keyboard)
+    ai_response = await get_ai_response(user_message, on_partial=reply.update)
+    
+    await reply.finish(
+        ai_response,
+        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]])
     )
-    return GET_LISTED_CONFIRM
 
-async def get_listed_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    query = update.callback_query
-    await query.answer()
-    
-    if query.data == 'get_listed_yes':
-        context.user_data['get_listed_active'] = True
-        await query.edit_message_text(
-            "🎯 *Step 1 of 32: Founder's Email*\n\n"
-            "Please provide your *email address* (founder's personal email):\n\n"
-            "💡 We'll use this to contact you about your submission\n\n"
-            "📻 *Important:* Before you continue, please listen to this X space for crucial information about intellectual property, revenues, and how MetaDAO works:\n"
-            "🔗 https://x.com/MetaDAOProject/status/1979608043370512715",
-            parse_mode='Markdown',
-            disable_web_page_preview=True
-        )
-        return FOUNDER_EMAIL
-    else:
-        await query.edit_message_text(
-            "👍 No problem! Feel free to come back anytime.",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]])
-        )
-        return ConversationHandler.END
-
-async def get_founder_email(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['founder_email'] = update.message.text
-    await update.message.reply_text(
-        "✅ Got it!\n\n"
-        "📧 *Step 2 of 32: Project Email*\n\n"
+# Field validators - each takes the raw answer (and the answers so far) and returns the
+# normalized value to store, or raises ValueError with the message shown before re-prompting
+SKIP_ANSWERS = frozenset(('none', 'skip', 'n/a', 'na', '-'))
+EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+\-]+@[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)*\.[A-Za-z]{2,}$')
+URL_RE = re.compile(r'^https?://[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)+(?::\d+)?(?:[/?#]\S*)?$', re.IGNORECASE)
+AMOUNT_RE = re.compile(
+    r'^\$?\s*(\d{1,3}(?:,\d{3})+|\d+)(\.\d+)?\s*([km])?\s*(?:\$|usdc?|dollars?|tokens?)?$',
+    re.IGNORECASE
+)
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+BASE58_RE = re.compile(f'^[{BASE58_ALPHABET}]{{32,44}}$')
+ADDRESS_SEPARATOR_RE = re.compile(r'[\s,;]+')
+MAX_SPENDING_LIMIT_ADDRESSES = 10
+MAX_PERFORMANCE_PACKAGE = 15_000_000
+
+def validate_email(text, user_data=None):
+    email = text.strip()
+    if not EMAIL_RE.match(email):
+        raise ValueError("That doesn't look like an email address. Please send it like *name@example.com*.")
+    local, domain = email.rsplit('@', 1)
+    return f"{local}@{domain.lower()}"
+
+def validate_url(text, user_data=None):
+    url = text.strip()
+    if '://' not in url:
+        url = 'https://' + url
+    if not URL_RE.match(url):
+        raise ValueError("That doesn't look like a link. Please send a full URL like *https://example.com/image.png*.")
+    return url
+
+def validate_optional_url(text, user_data=None):
+    """A URL, or '' when the answer is none/skip"""
+    return '' if text.strip().lower() in SKIP_ANSWERS else validate_url(text)
+
+def parse_amount(text):
+    """'$50,000', '50000 USDC', '50k' or '1.5M' as a number, None if it is not an amount"""
+    match = AMOUNT_RE.match(text.strip())
+    if not match:
+        return None
+    whole, fraction, suffix = match.groups()
+    amount = float(whole.replace(',', '') + (fraction or ''))
+    amount *= {'k': 1_000, 'm': 1_000_000}.get((suffix or '').lower(), 1)
+    return int(amount) if amount.is_integer() else round(amount, 2)
+
+def is_solana_address(address):
+    """Base58 text that decodes to a 32-byte public key"""
+    if not BASE58_RE.match(address):
+        return False
+    number = 0
+    for char in address:
+        number = number * 58 + BASE58_ALPHABET.index(char)
+    leading_zeros = len(address) - len(address.lstrip('1'))
+    return leading_zeros + (number.bit_length() + 7) // 8 == 32
+
+def validate_min_raise(text, user_data=None):
+    amount = parse_amount(text)
+    if not amount:
+        raise ValueError("Please send the minimum raise as a positive amount, e.g. *$50,000* or *50000 USDC*.")
+    return amount
+
+def validate_monthly_budget(text, user_data):
+    amount = parse_amount(text)
+    if not amount:
+        raise ValueError("Please send the monthly budget as a positive amount, e.g. *$10,000*.")
+    min_raise = user_data.get('min_raise')
+    if isinstance(min_raise, (int, float)) and amount > min_raise / 6:
+        raise ValueError(f"The monthly budget can be at most 1/6 of your minimum raise, i.e. *${min_raise / 6:,.0f}*.")
+    return amount
+
+def validate_performance_package(text, user_data=None):
+    amount = parse_amount(text)
+    if amount is None or amount != int(amount) or amount > MAX_PERFORMANCE_PACKAGE:
+        raise ValueError("Please send a whole number of tokens between *0* and *15000000* (15M).")
+    return int(amount)
+
+def validate_payout_address(text, user_data):
+    address = text.strip()
+    if address.lower() in SKIP_ANSWERS:
+        if user_data.get('performance_package'):
+            raise ValueError("You allocated a performance package, so a payout wallet address is required.")
+        return ''
+    if not is_solana_address(address):
+        raise ValueError("That isn't a valid Solana wallet address. Please check it and send it again.")
+    return address
+
+def validate_spending_limit_addresses(text, user_data=None):
+    addresses = list(dict.fromkeys(a for a in ADDRESS_SEPARATOR_RE.split(text.strip()) if a))
+    if not addresses:
+        raise ValueError("Please send at least one Solana wallet address.")
+    if len(addresses) > MAX_SPENDING_LIMIT_ADDRESSES:
+        raise ValueError(f"Please send at most {MAX_SPENDING_LIMIT_ADDRESSES} addresses, you sent {len(addresses)}.")
+    for position, address in enumerate(addresses, 1):
+        if not is_solana_address(address):
+            raise ValueError(f"Address {position} isn't a valid Solana wallet address. Please check it and send the list again.")
+    return ', '.join(addresses)
+
+def _same_as_project_image(text, user_data):
+    return user_data['project_image'] if text.strip().lower() == 'same' else validate_url(text)
+
+# Get Listed form - one declarative step per field. The prompts, the ConversationHandler states,
+# the submission's extra_data and the sheet layout are all derived from GET_LISTED_STEPS.
+@dataclass(frozen=True)
+class FormStep:
+    key: str                     # user_data / extra_data key
+    label: str                   # field name in the sheet
+    emoji: str
+    title: str
+    prompt: str
+    ack: str = "✅ Got it!"      # precedes the next prompt, {value} is the stored answer
+    choices: tuple = ()          # (callback_data, button, value) - answered with a button instead of text
+    validate: Optional[Callable] = None  # (text, user_data) -> value to store, ValueError re-prompts
+
+GET_LISTED_STEPS = (
+    FormStep(
+        'founder_email', 'Founder Email', "🎯", "Founder's Email",
+        "Please provide your *email address* (founder's personal email):\n\n"
+        "💡 We'll use this to contact you about your submission\n\n"
+        "📻 *Important:* Before you continue, please listen to this X space for crucial information about intellectual property, revenues, and how MetaDAO works:\n"
+        "🔗 https://x.com/MetaDAOProject/status/1979608043370512715",
+        validate=validate_email,
+    ),
+    FormStep(
+        'project_email', 'Project Email', "📧", "Project Email",
         "Please provide your *project's official email address*:\n\n"
         "💡 This is the email for your project/company (can be the same as founder's email if you don't have a separate one)",
-        parse_mode='Markdown'
-    )
-    return PROJECT_EMAIL
-
-async def get_project_email(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['project_email'] = update.message.text
-    await update.message.reply_text(
-        "✅ Perfect!\n\n"
-        "🎯 *Step 3 of 32: Project Name & Short Description*\n\n"
+        ack="✅ Perfect!",
+        validate=validate_email,
+    ),
+    FormStep(
+        'project_name_short', 'Project Name Short', "🎯", "Project Name & Short Description",
         "Please provide your *project name* and a *1-2 sentence description*:\n\n"
         "💡 *Example:*\n"
         "\"Umbra - A privacy-focused DeFi protocol enabling anonymous transactions on Solana.\"\n\n"
         "This will be displayed on the MetaDAO site and trading venues.",
-        parse_mode='Markdown'
-    )
-    return PROJECT_NAME_SHORT
-
-async def get_project_name_short(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['project_name_short'] = update.message.text
-    
-    keyboard = [
-        [InlineKeyboardButton("💰 DeFi", callback_data='category_defi')],
-        [InlineKeyboardButton("🌐 DePIN", callback_data='category_depin')],
-        [InlineKeyboardButton("🏗️ Infrastructure", callback_data='category_infrastructure')],
-        [InlineKeyboardButton("🎮 Gaming", callback_data='category_gaming')],
-        [InlineKeyboardButton("🖼️ NFT/Metaverse", callback_data='category_nft')],
-        [InlineKeyboardButton("👥 Social", callback_data='category_social')],
-        [InlineKeyboardButton("📦 Other", callback_data='category_other')]
-    ]
-    
-    await update.message.reply_text(
-        "✅ Great start!\n\n"
-        "🏷️ *Step 4 of 32: Project Category*\n\n"
+        ack="✅ Great start!",
+    ),
+    FormStep(
+        'project_category', 'Project Category', "🏷️", "Project Category",
         "Please select the category that best describes your project:\n\n"
         "💰 *DeFi* - Decentralized Finance\n"
         "🌐 *DePIN* - Decentralized Physical Infrastructure\n"
@@ -896,169 +2087,91 @@ async def get_project_name_short(update: Update, context: ContextTypes.DEFAULT_T
         "🖼️ *NFT/Metaverse* - NFTs and metaverse projects\n"
         "👥 *Social* - Social platforms and communities\n"
         "📦 *Other* - Other categories",
-        parse_mode='Markdown',
-        reply_markup=InlineKeyboardMarkup(keyboard)
-    )
-    return PROJECT_CATEGORY
-
-async def get_project_category(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    query = update.callback_query
-    await query.answer()
-    
-    category_map = {
-        'category_defi': 'DeFi',
-        'category_depin': 'DePIN',
-        'category_infrastructure': 'Infrastructure',
-        'category_gaming': 'Gaming',
-        'category_nft': 'NFT/Metaverse',
-        'category_social': 'Social',
-        'category_other': 'Other'
-    }
-    
-    category = category_map.get(query.data, 'Other')
-    context.user_data['project_category'] = category
-    
-    await query.edit_message_text(
-        f"✅ Category selected: *{category}*\n\n"
-        "📝 *Step 5 of 32: Detailed Description*\n\n"
+        ack="✅ Category selected: *{value}*",
+        choices=(
+            ('category_defi', "💰 DeFi", 'DeFi'),
+            ('category_depin', "🌐 DePIN", 'DePIN'),
+            ('category_infrastructure', "🏗️ Infrastructure", 'Infrastructure'),
+            ('category_gaming', "🎮 Gaming", 'Gaming'),
+            ('category_nft', "🖼️ NFT/Metaverse", 'NFT/Metaverse'),
+            ('category_social', "👥 Social", 'Social'),
+            ('category_other', "📦 Other", 'Other'),
+        ),
+    ),
+    FormStep(
+        'project_desc_long', 'Project Description', "📝", "Detailed Description",
         "Now provide a *longer, more detailed description* of your project:\n\n"
         "💡 *What to include:*\n"
         "• Your mission and vision\n"
         "• Key features and functionality\n"
         "• What makes your project unique\n"
         "• Why someone should want to participate in its upside",
-        parse_mode='Markdown'
-    )
-    return PROJECT_DESC_LONG
-
-async def get_project_desc_long(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['project_desc_long'] = update.message.text
-    await update.message.reply_text(
-        "✅ Excellent!\n\n"
-        "🪙 *Step 6 of 32: Token Name*\n\n"
+        ack="✅ Excellent!",
+    ),
+    FormStep(
+        'token_name', 'Token Name', "🪙", "Token Name",
         "What is your *token name*?\n\n"
         "💡 *Example:* \"Omnipair\" or \"Umbra Token\"",
-        parse_mode='Markdown'
-    )
-    return TOKEN_NAME
-
-async def get_token_name(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['token_name'] = update.message.text
-    await update.message.reply_text(
-        "✅ Got it!\n\n"
-        "🏷️ *Step 7 of 32: Token Ticker*\n\n"
+    ),
+    FormStep(
+        'token_ticker', 'Token Ticker', "🏷️", "Token Ticker",
         "What is your *token ticker symbol*?\n\n"
         "💡 *Example:* \"OMFG\" for Omnipair or \"UMBRA\"",
-        parse_mode='Markdown'
-    )
-    return TOKEN_TICKER
-
-async def get_token_ticker(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['token_ticker'] = update.message.text
-    await update.message.reply_text(
-        "✅ Perfect!\n\n"
-        "🖼️ *Step 8 of 32: Project Image*\n\n"
+        ack="✅ Perfect!",
+    ),
+    FormStep(
+        'project_image', 'Project Image', "🖼️", "Project Image",
         "Please provide the *URL for your project image*:\n\n"
         "💡 Supported formats: PNG, JPG, SVG\n"
         "💡 Recommended size: 512x512px or larger",
-        parse_mode='Markdown'
-    )
-    return PROJECT_IMAGE
-
-async def get_project_image(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['project_image'] = update.message.text
-    await update.message.reply_text(
-        "✅ Image saved!\n\n"
-        "🎨 *Step 9 of 32: Token Image*\n\n"
+        ack="✅ Image saved!",
+        validate=validate_url,
+    ),
+    FormStep(
+        'token_image', 'Token Image', "🎨", "Token Image",
         "Please provide the *URL for your token image*:\n\n"
         "💡 This will be displayed on trading venues like Jupiter\n"
         "💡 Type 'same' if it's the same as your project image",
-        parse_mode='Markdown'
-    )
-    return TOKEN_IMAGE
-
-async def get_token_image(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    token_image = update.message.text
-    if token_image.lower() == 'same':
-        context.user_data['token_image'] = context.user_data['project_image']
-    else:
-        context.user_data['token_image'] = token_image
-    await update.message.reply_text(
-        "✅ Looks good!\n\n"
-        "💵 *Step 10 of 32: Minimum Raise Amount*\n\n"
+        ack="✅ Looks good!",
+        validate=_same_as_project_image,
+    ),
+    FormStep(
+        'min_raise', 'Minimum Raise', "💵", "Minimum Raise Amount",
         "What is your *minimum raise amount*?\n\n"
         "💡 This is how much your project needs to proceed\n"
         "💡 If you raise less than this, the sale will be refunded\n\n"
         "💡 *Example:* \"$50,000\" or \"50000 USDC\"",
-        parse_mode='Markdown'
-    )
-    return MIN_RAISE
-
-async def get_min_raise(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['min_raise'] = update.message.text
-    await update.message.reply_text(
-        "✅ Noted!\n\n"
-        "📊 *Step 11 of 32: Monthly Team Budget*\n\n"
+        ack="✅ Noted!",
+        validate=validate_min_raise,
+    ),
+    FormStep(
+        'monthly_budget', 'Monthly Budget', "📊", "Monthly Team Budget",
         "What is your *monthly team budget*?\n\n"
         "💡 This is how much your team needs every month from the treasury\n"
         "💡 Cannot be larger than 1/6th of your minimum raise amount\n\n"
         "💡 *Example:* \"$10,000\"",
-        parse_mode='Markdown'
-    )
-    return MONTHLY_BUDGET
-
-async def get_monthly_budget(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['monthly_budget'] = update.message.text
-    await update.message.reply_text(
-        "✅ Understood!\n\n"
-        "🎁 *Step 12 of 32: Performance Package*\n\n"
+        ack="✅ Understood!",
+        validate=validate_monthly_budget,
+    ),
+    FormStep(
+        'performance_package', 'Performance Package', "🎁", "Performance Package",
         "How many tokens do you want to allocate to the *performance package*?\n\n"
         "💡 You can pre-allocate up to 15M additional tokens\n"
         "💡 The package splits into 5 equal tranches that unlock at 2x, 4x, 8x, 16x, and 32x ICO price\n\n"
         "💡 *Example:* \"10000000\" (10M tokens) or \"0\" (no performance package)",
-        parse_mode='Markdown'
-    )
-    return PERFORMANCE_PACKAGE
-
-async def get_performance_package(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['performance_package'] = update.message.text
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "⏰ *Step 13 of 32: Minimum Unlock Time*\n\n"
+        ack="✅ Great!",
+        validate=validate_performance_package,
+    ),
+    FormStep(
+        'performance_unlock_time', 'Performance Unlock Time', "⏰", "Minimum Unlock Time",
         "What is the *minimum unlock time* for the performance package?\n\n"
         "💡 Must be at least 18 months from ICO date\n"
         "💡 *Example:* \"18 months\" or \"24 months\"\n"
         "💡 Type 'skip' if you didn't allocate a performance package",
-        parse_mode='Markdown'
-    )
-    return PERFORMANCE_UNLOCK_TIME
-
-async def get_performance_unlock_time(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['performance_unlock_time'] = update.message.text
-    await update.message.reply_text(
-        "✅ Noted!\n\n"
-        "📜 *Step 14 of 32: Intellectual Property*\n\n"
+        ack="✅ Noted!",
+    ),
+    FormStep(
+        'intellectual_property', 'Intellectual Property', "📜", "Intellectual Property",
         "⚠️ *IMPORTANT WARNING:*\n"
         "When you fill out your document, it MUST include a complete list of intellectual properties that the founder(s) will give up to the project's entity.\n\n"
         "*This includes but is not limited to:*\n"
@@ -1072,204 +2185,104 @@ async def get_performance_unlock_time(update: Update, context: ContextTypes.DEFA
         "Note: In the following steps, we will ask for specific links including domain, Discord, Telegram, documentation, X/Twitter, GitHub, YouTube, and Medium.\n\n"
         "Please list ALL additional intellectual property that will be transferred to the project's entity (e.g., revenue rights, trademarks, patents, brand assets) excluding the specific links requested later:\n\n"
         "💡 Type 'none' if you don't have any additional intellectual property to transfer",
-        parse_mode='Markdown'
-    )
-    return INTELLECTUAL_PROPERTY
-
-async def get_intellectual_property(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['intellectual_property'] = update.message.text
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "🌐 *Step 15 of 32: Domain*\n\n"
+        ack="✅ Great!",
+    ),
+    FormStep(
+        'domain', 'Domain', "🌐", "Domain",
         "What is your *project's website domain*?\n\n"
         "💡 *Example:* \"https://myproject.com\"\n"
         "💡 Type 'none' if you don't have a website",
-        parse_mode='Markdown'
-    )
-    return DOMAIN
-
-async def get_domain(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['domain'] = update.message.text
-    await update.message.reply_text(
-        "✅ Got it!\n\n"
-        "💬 *Step 16 of 32: Discord*\n\n"
+    ),
+    FormStep(
+        'discord', 'Discord', "💬", "Discord",
         "What is your *Discord server invite link*?\n\n"
         "💡 *Example:* \"https://discord.gg/myproject\"\n"
         "💡 Type 'none' if you don't have a Discord server",
-        parse_mode='Markdown'
-    )
-    return DISCORD
-
-async def get_discord(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['discord'] = update.message.text
-    await update.message.reply_text(
-        "✅ Noted!\n\n"
-        "📱 *Step 17 of 32: Telegram*\n\n"
+        ack="✅ Noted!",
+    ),
+    FormStep(
+        'telegram', 'Telegram', "📱", "Telegram",
         "What is your *Telegram group/channel link*?\n\n"
         "💡 *Example:* \"https://t.me/myproject\"\n"
         "💡 Type 'none' if you don't have a Telegram community",
-        parse_mode='Markdown'
-    )
-    return TELEGRAM_LINK
-
-async def get_telegram_link(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['telegram'] = update.message.text
-    await update.message.reply_text(
-        "✅ Perfect!\n\n"
-        "📚 *Step 18 of 32: Documentation*\n\n"
+        ack="✅ Perfect!",
+    ),
+    FormStep(
+        'docs', 'Docs', "📚", "Documentation",
         "What is your *documentation link*?\n\n"
         "💡 *Example:* \"https://docs.myproject.com\"\n"
         "💡 Type 'none' if you don't have documentation yet",
-        parse_mode='Markdown'
-    )
-    return DOCS
-
-async def get_docs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['docs'] = update.message.text
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "🐦 *Step 19 of 32: X (Twitter)*\n\n"
+        ack="✅ Great!",
+    ),
+    FormStep(
+        'x_twitter', 'X/Twitter', "🐦", "X (Twitter)",
         "What is your *X/Twitter profile link*?\n\n"
         "💡 *Example:* \"https://x.com/myproject\"\n"
         "💡 Type 'none' if you don't have an X/Twitter profile",
-        parse_mode='Markdown'
-    )
-    return X_TWITTER
-
-async def get_x_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['x_twitter'] = update.message.text
-    await update.message.reply_text(
-        "✅ Saved!\n\n"
-        "💻 *Step 20 of 32: GitHub*\n\n"
+        ack="✅ Saved!",
+    ),
+    FormStep(
+        'github', 'GitHub', "💻", "GitHub",
         "What is your *GitHub repository link*?\n\n"
         "💡 *Example:* \"https://github.com/myproject\"\n"
         "💡 Type 'none' if your code isn't open source",
-        parse_mode='Markdown'
-    )
-    return GITHUB
-
-async def get_github(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['github'] = update.message.text
-    await update.message.reply_text(
-        "✅ Got it!\n\n"
-        "📺 *Step 21 of 32: YouTube*\n\n"
+    ),
+    FormStep(
+        'youtube', 'YouTube', "📺", "YouTube",
         "What is your *YouTube channel link*?\n\n"
         "💡 *Example:* \"https://youtube.com/@myproject\"\n"
         "💡 Type 'none' if you don't have a YouTube channel",
-        parse_mode='Markdown'
-    )
-    return YOUTUBE
-
-async def get_youtube(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['youtube'] = update.message.text
-    await update.message.reply_text(
-        "✅ Noted!\n\n"
-        "📝 *Step 22 of 32: Medium*\n\n"
+        ack="✅ Noted!",
+    ),
+    FormStep(
+        'medium', 'Medium', "📝", "Medium",
         "What is your *Medium blog link*?\n\n"
         "💡 *Example:* \"https://medium.com/myproject\"\n"
         "💡 Type 'none' if you don't have a Medium blog",
-        parse_mode='Markdown'
-    )
-    return MEDIUM
-
-async def get_medium(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['medium'] = update.message.text
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "📅 *Step 23 of 32: Calendly*\n\n"
+        ack="✅ Great!",
+    ),
+    FormStep(
+        'calendly', 'Calendly', "📅", "Calendly",
         "What is your *Calendly booking link*?\n\n"
         "💡 This allows investors to schedule meetings with you\n"
         "💡 *Example:* \"https://calendly.com/myproject\"\n"
         "💡 Type 'none' if you don't use Calendly",
-        parse_mode='Markdown'
-    )
-    return CALENDLY
-
-async def get_calendly(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['calendly'] = update.message.text
-    await update.message.reply_text(
-        "✅ Perfect!\n\n"
-        "💳 *Step 24 of 32: Insider Allocation Payout Address*\n\n"
+        ack="✅ Perfect!",
+    ),
+    FormStep(
+        'insider_payout_address', 'Insider Payout Address', "💳", "Insider Allocation Payout Address",
         "What is the *wallet address* for insider allocation payouts?\n\n"
         "💡 This is where performance package tokens will be sent\n"
         "💡 Type 'skip' if you didn't allocate a performance package",
-        parse_mode='Markdown'
-    )
-    return INSIDER_PAYOUT_ADDRESS
-
-async def get_insider_payout_address(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['insider_payout_address'] = update.message.text
-    await update.message.reply_text(
-        "✅ Saved!\n\n"
-        "👥 *Step 25 of 32: Spending Limit Members Addresses*\n\n"
+        ack="✅ Saved!",
+        validate=validate_payout_address,
+    ),
+    FormStep(
+        'spending_limit_addresses', 'Spending Limit Addresses', "👥", "Spending Limit Members Addresses",
         "Please provide *wallet addresses* for spending limit members (up to 10):\n\n"
         "💡 These addresses will have spending authority up to the limit\n"
         "💡 Separate multiple addresses with commas\n"
         "💡 *Example:* \"addr1..., addr2..., addr3...\"",
-        parse_mode='Markdown'
-    )
-    return SPENDING_LIMIT_ADDRESSES
-
-async def get_spending_limit_addresses(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['spending_limit_addresses'] = update.message.text
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "📰 *Step 26 of 32: X Article About the Project*\n\n"
+        ack="✅ Great!",
+        validate=validate_spending_limit_addresses,
+    ),
+    FormStep(
+        'x_article', 'X Article', "📰", "X Article About the Project",
         "Please provide a *link to an X/Twitter article* about your project:\n\n"
         "💡 This could be an announcement thread, detailed explanation, or project overview\n"
         "💡 Type 'none' if you don't have one yet",
-        parse_mode='Markdown'
-    )
-    return X_ARTICLE
-
-async def get_x_article(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    context.user_data['x_article'] = update.message.text
-    await update.message.reply_text(
-        "✅ Almost done!\n\n"
-        "👤 *Step 27 of 32: Founders' Socials and Speeches*\n\n"
+        ack="✅ Almost done!",
+    ),
+    FormStep(
+        'founders_socials', 'Founders Socials', "👤", "Founders' Socials and Speeches",
         "Please provide *links to founders' social media profiles and any speeches/presentations*:\n\n"
         "💡 Include X/Twitter, LinkedIn, YouTube talks, podcast appearances, etc.\n"
         "💡 Separate multiple links with commas\n"
         "💡 *Example:* \"https://x.com/founder1, https://linkedin.com/in/founder2\"",
-        parse_mode='Markdown'
-    )
-    return FOUNDERS_SOCIALS
-
-async def get_founders_socials(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    context.user_data['founders_socials'] = update.message.text
-    
-    await update.message.reply_text(
-        "✅ Excellent!\n\n"
-        "👥 *Step 28 of 32: Team Background*\n\n"
+        ack="✅ Excellent!",
+    ),
+    FormStep(
+        'team_background', 'Team Background', "👥", "Team Background",
         "Please provide information about your team:\n\n"
         "💡 *What to include:*\n"
         "• Size of your team\n"
@@ -1277,19 +2290,10 @@ async def get_founders_socials(update: Update, context: ContextTypes.DEFAULT_TYP
         "• Founder backgrounds and achievements\n"
         "• Relevant experience in the industry\n\n"
         "💡 *Example:* \"Team of 8 members including 4 engineers with backgrounds from Google and Meta. Founder previously built a DeFi protocol with $50M TVL.\"",
-        parse_mode='Markdown'
-    )
-    return TEAM_BACKGROUND
-
-async def get_team_background(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    context.user_data['team_background'] = update.message.text
-    
-    await update.message.reply_text(
-        "✅ Great!\n\n"
-        "📅 *Step 29 of 32: Timeline*\n\n"
+        ack="✅ Great!",
+    ),
+    FormStep(
+        'timeline', 'Timeline', "📅", "Timeline",
         "Please provide your project timeline:\n\n"
         "💡 *What to include:*\n"
         "• When was the project formed?\n"
@@ -1297,19 +2301,10 @@ async def get_team_background(update: Update, context: ContextTypes.DEFAULT_TYPE
         "• Anticipated mainnet launch date (if applicable)\n"
         "• Key milestones achieved so far\n\n"
         "💡 *Example:* \"Founded in Q2 2024. Currently on testnet with 10K+ users. Mainnet launch planned for Q1 2025.\"",
-        parse_mode='Markdown'
-    )
-    return TIMELINE
-
-async def get_timeline(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    context.user_data['timeline'] = update.message.text
-    
-    await update.message.reply_text(
-        "✅ Perfect!\n\n"
-        "🏆 *Step 30 of 32: Recognition & Achievements*\n\n"
+        ack="✅ Perfect!",
+    ),
+    FormStep(
+        'recognition', 'Recognition', "🏆", "Recognition & Achievements",
         "Please share any recognition your project has received:\n\n"
         "💡 *What to include:*\n"
         "• VC backing and funding rounds\n"
@@ -1319,19 +2314,10 @@ async def get_timeline(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         "• Media coverage or press mentions\n\n"
         "💡 *Example:* \"Backed by Solana Ventures and Multicoin Capital. Graduate of Alliance DAO. Winner of Solana Hackathon 2024.\"\n"
         "💡 Type 'none' if you don't have any recognition yet",
-        parse_mode='Markdown'
-    )
-    return RECOGNITION
-
-async def get_recognition(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    context.user_data['recognition'] = update.message.text
-    
-    await update.message.reply_text(
-        "✅ Awesome!\n\n"
-        "🎯 *Step 31 of 32: Competitors & Market Vision*\n\n"
+        ack="✅ Awesome!",
+    ),
+    FormStep(
+        'competitors_vision', 'Competitors Vision', "🎯", "Competitors & Market Vision",
         "Please describe your competitive landscape and market vision:\n\n"
         "💡 *What to include:*\n"
         "• Who are your main competitors?\n"
@@ -1340,19 +2326,10 @@ async def get_recognition(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         "• Market size and growth potential\n"
         "• Your unique positioning\n\n"
         "💡 *Example:* \"Competing with Uniswap and Jupiter, but focused on privacy-first swaps. We see the privacy DEX market growing to $10B+ as regulations tighten.\"",
-        parse_mode='Markdown'
-    )
-    return COMPETITORS_VISION
-
-async def get_competitors_vision(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    if not context.user_data.get('get_listed_active'):
-        return ConversationHandler.END
-    
-    context.user_data['competitors_vision'] = update.message.text
-    
-    await update.message.reply_text(
-        "✅ Final step!\n\n"
-        "📝 *Step 32 of 32: Miscellaneous*\n\n"
+        ack="✅ Final step!",
+    ),
+    FormStep(
+        'misc', 'Misc', "📝", "Miscellaneous",
         "Is there anything else you'd like to share about your project?\n\n"
         "💡 *This could include:*\n"
         "• Additional context not covered above\n"
@@ -1360,68 +2337,150 @@ async def get_competitors_vision(update: Update, context: ContextTypes.DEFAULT_T
         "• Unique aspects of your project\n"
         "• Any other relevant information\n\n"
         "💡 Type 'none' if you don't have anything else to add",
-        parse_mode='Markdown'
+    ),
+)
+
+# Conversation states follow GET_LISTED_CONFIRM in step order
+GET_LISTED_FIRST_STEP = GET_LISTED_CONFIRM + 1
+GET_LISTED_STEP_STATES = {GET_LISTED_FIRST_STEP + index: index for index in range(len(GET_LISTED_STEPS))}
+GET_LISTED_PROMPTS = tuple(
+    f"{step.emoji} *Step {index + 1} of {len(GET_LISTED_STEPS)}: {step.title}*\n\n{step.prompt}"
+    for index, step in enumerate(GET_LISTED_STEPS)
+)
+GET_LISTED_KEYBOARDS = tuple(
+    InlineKeyboardMarkup([[InlineKeyboardButton(button, callback_data=data)] for data, button, _ in step.choices])
+    if step.choices else None
+    for step in GET_LISTED_STEPS
+)
+# Sheet layout (label, extra_data key) after the timestamp
+GET_LISTED_SHEET_FIELDS = tuple((step.label, step.key) for step in GET_LISTED_STEPS) + (
+    ('Founder Username', 'founder_username'),
+    ('Founder ID', 'founder_id'),
+)
+# Header rows of the sheets written one row per submission, in Submission.table_row() order
+SHEET_TABLE_HEADERS = {
+    SUPPORT_TABLE: ['Timestamp', 'Name', 'Email', 'Question', 'Category', 'Subcategory', 'Image URL'],
+    GET_LISTED_TABLE: ['Submission ID', 'Timestamp'] + [label for label, _ in GET_LISTED_SHEET_FIELDS],
+}
+
+async def get_listed_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    query = update.callback_query
+    await query.answer()
+    
+    keyboard = [
+        [InlineKeyboardButton("✅ Yes, let's get started!", callback_data='get_listed_yes')],
+        [InlineKeyboardButton("⬅️ Back to Main Menu", callback_data='main_menu')]
+    ]
+    
+    await query.edit_message_text(
+        "🚀 *Get Your Project Listed on MetaDAO*\n\n"
+        "To get listed, you'll need to provide:\n\n"
+        "📝 *Project Information:*\n"
+        "• Project category (DeFi, DePIN, Gaming, etc.)\n"
+        "• Project name and description (short & long versions)\n"
+        "• Token name, ticker, and address\n"
+        "• Links (domain, docs, social media, GitHub, YouTube, Medium, Calendly)\n\n"
+        "🖼️ *Visual Assets:*\n"
+        "• Project image and token image\n\n"
+        "💰 *Financial Details:*\n"
+        "• Minimum raise amount\n"
+        "• Maximum spending limit\n"
+        "• Monthly team budget\n"
+        "• Performance package configuration (optional)\n"
+        "• Start and end dates\n"
+        "• Payout addresses\n\n"
+        "📜 *Additional:*\n"
+        "• Intellectual property list\n"
+        "• X article about the project\n"
+        "• Founders' socials and speeches\n"
+        "• Team background and highlights\n"
+        "• Timeline and progress stage\n"
+        "• Recognition and achievements\n"
+        "• Competitors and market vision\n\n"
+        "⏱️ *Time required:* ~15-20 minutes\n\n"
+        "Ready to begin?",
+        parse_mode='Markdown',
+        reply_markup=InlineKeyboardMarkup(keyboard)
     )
-    return MISC
+    return GET_LISTED_CONFIRM
+
+async def get_listed_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    query = update.callback_query
+    await query.answer()
+    
+    if query.data == 'get_listed_yes':
+        context.user_data['get_listed_active'] = True
+        await query.edit_message_text(
+            GET_LISTED_PROMPTS[0],
+            parse_mode='Markdown',
+            reply_markup=GET_LISTED_KEYBOARDS[0],
+            disable_web_page_preview=True
+        )
+        return GET_LISTED_FIRST_STEP
+    else:
+        await query.edit_message_text(
+            "👍 No problem! Feel free to come back anytime.",
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]])
+        )
+        return ConversationHandler.END
 
-async def get_misc(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+async def get_listed_answer(update: Update, context: ContextTypes.DEFAULT_TYPE, index: int) -> Optional[int]:
+    """Stores the answer to Get Listed step `index` and asks the next one - each conversation
+    state is bound to its step index when the handlers are built"""
     if not context.user_data.get('get_listed_active'):
         return ConversationHandler.END
     
-    context.user_data['misc'] = update.message.text
+    step = GET_LISTED_STEPS[index]
     
+    query = update.callback_query
+    if query:
+        await query.answer()
+        value = next((value for data, _, value in step.choices if data == query.data), step.choices[-1][2])
+        reply = query.edit_message_text
+    else:
+        value = update.message.text
+        reply = update.message.reply_text
+    
+    if step.validate:
+        try:
+            value = step.validate(value, context.user_data)
+        except ValueError as e:
+            await reply(f"⚠️ {e}", parse_mode='Markdown', reply_markup=GET_LISTED_KEYBOARDS[index])
+            return None  # Stay on this step
+    context.user_data[step.key] = value
+    
+    if index + 1 == len(GET_LISTED_STEPS):
+        return await submit_get_listed(update, context)
+    
+    await reply(
+        f"{step.ack.format(value=value)}\n\n{GET_LISTED_PROMPTS[index + 1]}",
+        parse_mode='Markdown',
+        reply_markup=GET_LISTED_KEYBOARDS[index + 1],
+        disable_web_page_preview=True
+    )
+    return GET_LISTED_FIRST_STEP + index + 1
+
+async def submit_get_listed(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     # Inform user that data is being processed
-    await update.message.reply_text(
+    await update.effective_message.reply_text(
         "⏳ *Processing your submission...*\n\n"
         "Please wait a moment while we save your project details.",
         parse_mode='Markdown'
     )
     
-    extra_data = {
-        'founder_email': context.user_data.get('founder_email', ''),
-        'project_email': context.user_data.get('project_email', ''),
-        'project_name_short': context.user_data.get('project_name_short', ''),
-        'project_category': context.user_data.get('project_category', ''),
-        'project_desc_long': context.user_data.get('project_desc_long', ''),
-        'token_name': context.user_data.get('token_name', ''),
-        'token_ticker': context.user_data.get('token_ticker', ''),
-        'project_image': context.user_data.get('project_image', ''),
-        'token_image': context.user_data.get('token_image', ''),
-        'min_raise': context.user_data.get('min_raise', ''),
-        'monthly_budget': context.user_data.get('monthly_budget', ''),
-        'performance_package': context.user_data.get('performance_package', ''),
-        'performance_unlock_time': context.user_data.get('performance_unlock_time', ''),
-        'intellectual_property': context.user_data.get('intellectual_property', ''),
-        'domain': context.user_data.get('domain', ''),
-        'discord': context.user_data.get('discord', ''),
-        'telegram': context.user_data.get('telegram', ''),
-        'docs': context.user_data.get('docs', ''),
-        'x_twitter': context.user_data.get('x_twitter', ''),
-        'github': context.user_data.get('github', ''),
-        'youtube': context.user_data.get('youtube', ''),
-        'medium': context.user_data.get('medium', ''),
-        'calendly': context.user_data.get('calendly', ''),
-        'insider_payout_address': context.user_data.get('insider_payout_address', ''),
-        'spending_limit_addresses': context.user_data.get('spending_limit_addresses', ''),
-        'x_article': context.user_data.get('x_article', ''),
-        'founders_socials': context.user_data.get('founders_socials', ''),
-        'team_background': context.user_data.get('team_background', ''),
-        'timeline': context.user_data.get('timeline', ''),
-        'recognition': context.user_data.get('recognition', ''),
-        'competitors_vision': context.user_data.get('competitors_vision', ''),
-        'misc': context.user_data.get('misc', ''),
-        'founder_username': update.effective_user.username or 'no_username',
-        'founder_id': update.effective_user.id
-    }
+    extra_data = {step.key: context.user_data.get(step.key, '') for step in GET_LISTED_STEPS}
+    extra_data['founder_username'] = update.effective_user.username or 'no_username'
+    extra_data['founder_id'] = update.effective_user.id
     
-    # Log to Google Sheets
-    log_request(
+    # Store locally, then log to Google Sheets in the background
+    submission = Submission(
+        'Get Listed',
         context.user_data['project_name_short'],
         update.effective_user.username or str(update.effective_user.id),
-        None,
-        'Get Listed',
         extra_data=extra_data
     )
+    submission.id = submission.idempotency_key(update.effective_user.id)
+    record_submission(submission)
     
     success_message = (
         "🎉 *Submission Complete!*\n\n"
@@ -1434,7 +2493,7 @@ async def get_misc(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         "Thank you for choosing MetaDAO! 🚀"
     )
     
-    await update.message.reply_text(
+    await update.effective_message.reply_text(
         success_message,
         parse_mode='Markdown',
         reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data='main_menu')]])
@@ -1455,6 +2514,326 @@ async def get_listed_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return ConversationHandler.END
     return ConversationHandler.END
 
+# Last known stored version per user/chat row and conversation, kept for at most this many entries
+PERSISTENCE_CACHE_SIZE = int(os.environ.get('PERSISTENCE_CACHE_SIZE', 10000))
+
+class SQLitePersistence(BasePersistence):
+    """Conversation state and user/chat data in the local store, so any instance can pick up a flow.
+
+    Nothing is loaded up front: the user/chat rows and conversation state an update touches are
+    read when it arrives, and changed entries are buffered until flush() writes them in a single
+    transaction. A refresh never overwrites changes that have not been flushed yet - live data is
+    only replaced when the store holds something newer than this instance last read or wrote.
+    """
+
+    def __init__(self):
+        super().__init__(
+            store_data=PersistenceInput(bot_data=False, chat_data=True, user_data=True, callback_data=False),
+            update_interval=60
+        )
+        self._pending = {}  # (table, id) -> JSON text, or None to delete
+        self._written = OrderedDict()  # (table, id) -> JSON text last read from / written to the store
+
+    @staticmethod
+    def _encode(data):
+        # An empty dict is the same as no row
+        return json.dumps(data, sort_keys=True) if data else None
+
+    def _remember(self, entry, data):
+        self._written[entry] = data
+        self._written.move_to_end(entry)
+        while len(self._written) > PERSISTENCE_CACHE_SIZE:
+            self._written.popitem(last=False)
+
+    def _is_unflushed(self, entry, live):
+        """True when live data changed after the last read or write, staged or not"""
+        if entry in self._pending:
+            return True
+        return entry in self._written and self._encode(live) != self._written[entry]
+
+    def _refresh(self, table, row_id, live):
+        entry = (table, row_id)
+        if self._is_unflushed(entry, live):
+            return
+        rows = store_execute(f'SELECT data FROM {table} WHERE id = ?', (row_id,))
+        data = rows[0]['data'] if rows else None
+        if entry not in self._written or data != self._written[entry]:
+            live.clear()
+            live.update(json.loads(data) if data else {})
+        self._remember(entry, data)
+
+    def _stage(self, table, row_id, data):
+        encoded = self._encode(data)
+        if self._written.get((table, row_id)) == encoded and (table, row_id) not in self._pending:
+            return
+        self._pending[(table, row_id)] = encoded
+
+    async def get_user_data(self):
+        return {}
+
+    async def get_chat_data(self):
+        return {}
+
+    async def get_bot_data(self):
+        return {}
+
+    async def get_callback_data(self):
+        return None
+
+    async def get_conversations(self, name):
+        return {}
+
+    async def refresh_user_data(self, user_id, user_data):
+        self._refresh('user_data', user_id, user_data)
+
+    async def refresh_chat_data(self, chat_id, chat_data):
+        self._refresh('chat_data', chat_id, chat_data)
+
+    async def refresh_bot_data(self, bot_data):
+        pass
+
+    async def update_user_data(self, user_id, data):
+        self._stage('user_data', user_id, data)
+
+    async def update_chat_data(self, chat_id, data):
+        self._stage('chat_data', chat_id, data)
+
+    async def update_bot_data(self, data):
+        pass
+
+    async def update_callback_data(self, data):
+        pass
+
+    async def drop_user_data(self, user_id):
+        self._stage('user_data', user_id, None)
+
+    async def drop_chat_data(self, chat_id):
+        self._stage('chat_data', chat_id, None)
+
+    async def update_conversation(self, name, key, new_state):
+        encoded = json.dumps(new_state) if new_state is not None else None
+        self._pending[('conversations', (name, json.dumps(list(key))))] = encoded
+
+    async def refresh_conversations(self, application, update):
+        """Load the stored state of every persistent conversation for this update's (chat, user)"""
+        if not (update.effective_chat and update.effective_user):
+            return
+        key = (update.effective_chat.id, update.effective_user.id)
+        stored_key = json.dumps(list(key))
+        rows = store_execute('SELECT name, state FROM conversations WHERE key = ?', (stored_key,))
+        stored = {row['name']: row['state'] for row in rows}
+        # The application keeps the live conversation dicts (TrackingDict) per handler name
+        for name, conversations in application._conversation_handler_conversations.items():
+            entry = ('conversations', (name, stored_key))
+            # A state set by an earlier update but not flushed yet is newer than the store
+            if entry in self._pending or key in conversations._write_access_keys:
+                continue
+            state = stored.get(name)
+            if entry in self._written and self._written[entry] == state:
+                continue
+            if state is not None:
+                conversations.update_no_track({key: json.loads(state)})
+            else:
+                conversations.data.pop(key, None)
+            self._remember(entry, state)
+
+    async def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        with _store_lock:
+            store_execute('BEGIN IMMEDIATE')
+            try:
+                for (table, row_id), data in pending.items():
+                    if table == 'conversations':
+                        name, key = row_id
+                        if data is None:
+                            store_execute('DELETE FROM conversations WHERE name = ? AND key = ?', (name, key))
+                        else:
+                            store_execute('INSERT OR REPLACE INTO conversations (name, key, state) VALUES (?, ?, ?)', (name, key, data))
+                    elif data is None:
+                        store_execute(f'DELETE FROM {table} WHERE id = ?', (row_id,))
+                    else:
+                        store_execute(f'INSERT OR REPLACE INTO {table} (id, data) VALUES (?, ?)', (row_id, data))
+                store_execute('COMMIT')
+            except Exception:
+                store_execute('ROLLBACK')
+                raise
+        for entry, data in pending.items():
+            self._remember(entry, data)
+        logger.info(f"Persisted {len(pending)} state change(s)")
+
+async def refresh_conversation_state(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Runs before every other handler group so conversations see state stored by other instances"""
+    await context.application.persistence.refresh_conversations(context.application, update)
+
+async def persist_update_state(app):
+    """Write the state touched by the processed update(s) in one transaction"""
+    await app.update_persistence()
+    await app.persistence.flush()
+
+# Update scheduling - updates of one chat/user run strictly in order (ConversationHandler
+# depends on it) while different chats run in parallel on a capped number of workers
+UPDATE_WORKERS = int(os.environ.get('UPDATE_WORKERS', 8))
+UPDATE_MAX_PENDING = int(os.environ.get('UPDATE_MAX_PENDING', 256))
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Serializes updates per chat (or user) and runs different chats concurrently.
+
+    A chat waits for its own previous update before it asks for a worker slot, so it holds at
+    most one slot at a time - a busy group cannot crowd private chats out of the worker pool.
+    """
+
+    def __init__(self, workers=UPDATE_WORKERS, max_pending=UPDATE_MAX_PENDING):
+        super().__init__(max(max_pending, workers))
+        self.workers = workers
+        self._worker_slots = asyncio.Semaphore(workers)
+        self._chat_locks = {}  # key -> [asyncio.Lock, number of updates holding or waiting]
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.processed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @staticmethod
+    def _order_key(update):
+        if isinstance(update, Update):
+            if update.effective_chat:
+                return ('chat', update.effective_chat.id)
+            if update.effective_user:
+                return ('user', update.effective_user.id)
+        return None
+
+    async def do_process_update(self, update, coroutine):
+        key = self._order_key(update)
+        if key is None:
+            # Nothing to keep in order (e.g. poll updates) - just take a worker slot
+            entry = [asyncio.Lock(), 1]
+        else:
+            entry = self._chat_locks.setdefault(key, [asyncio.Lock(), 0])
+            entry[1] += 1
+        queued_at = time.monotonic()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        waiting = True
+        try:
+            async with entry[0], self._worker_slots:
+                waited = time.monotonic() - queued_at
+                self.queue_depth -= 1
+                waiting = False
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+                await coroutine
+                self.processed += 1
+        finally:
+            if waiting:
+                self.queue_depth -= 1
+            entry[1] -= 1
+            if key is not None and entry[1] == 0:
+                del self._chat_locks[key]
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        logger.info(f"Update scheduler stats: {self.stats()}")
+
+    def stats(self):
+        return {
+            'processed': self.processed,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'active_chats': len(self._chat_locks),
+            'avg_wait_ms': round(1000 * self.total_wait / self.processed, 1) if self.processed else 0.0,
+            'max_wait_ms': round(1000 * self.max_wait, 1),
+        }
+
+async def dispatch_update(app, update):
+    """Process an update through the application's scheduler (per-chat order, bounded workers)"""
+    await app.update_processor.process_update(update, app.process_update(update))
+
+# Bot command menus - registered with Telegram by `sync-commands` (a deploy step), never on cold start
+PRIVATE_COMMANDS = [
+    BotCommand("start", "Start the bot and show main menu"),
+    BotCommand("help", "Show help information"),
+    BotCommand("cancel", "Cancel current operation")
+]
+GROUP_COMMANDS = [
+    BotCommand("ca", "Get META contract address"),
+    BotCommand("web", "Get MetaDAO website link"),
+    BotCommand("docs", "Get documentation link"),
+    BotCommand("icos", "Get calendar and ICOs link"),
+    BotCommand("markets", "View active markets"),
+    BotCommand("twitter", "Follow us on Twitter/X"),
+    BotCommand("telegram", "Join our Telegram community"),
+    BotCommand("discord", "Join our Discord server"),
+    BotCommand("youtube", "Subscribe to our YouTube"),
+    BotCommand("blog", "Read our blog"),
+    BotCommand("futarchyamm", "View AMM metrics"),
+    BotCommand("github", "Explore our GitHub")
+]
+
+GROUP_COMMAND_NAMES = frozenset(c.command for c in GROUP_COMMANDS)
+
+def bot_commands_hash():
+    """Stable hash of both command menus, changes whenever a command or description does"""
+    menus = {
+        scope: [[c.command, c.description] for c in commands]
+        for scope, commands in (('private', PRIVATE_COMMANDS), ('group', GROUP_COMMANDS))
+    }
+    return hashlib.sha256(json.dumps(menus, sort_keys=True).encode()).hexdigest()
+
+async def sync_bot_commands(bot, force=False):
+    """Register the command menus with Telegram unless this exact version is already registered"""
+    digest = bot_commands_hash()
+    if not force and store_get('bot_commands_hash') == digest:
+        logger.info(f"Bot commands already up to date ({digest[:12]})")
+        return False
+    await bot.delete_my_commands()
+    await bot.set_my_commands(PRIVATE_COMMANDS, scope=BotCommandScopeAllPrivateChats())
+    await bot.set_my_commands(GROUP_COMMANDS, scope=BotCommandScopeAllGroupChats())
+    store_set('bot_commands_hash', digest)
+    logger.info(f"Bot commands configured ({digest[:12]}): conversation commands for private chats only, info commands for groups only")
+    return True
+
+# getMe cache - BOT_INFO_JSON (printed by `sync-commands`) or the local store lets a cold
+# instance skip the getMe round trip that Bot.initialize() would otherwise make
+BOT_INFO_JSON = os.environ.get('BOT_INFO_JSON', '')
+
+def load_cached_bot_info():
+    """Cached getMe result for this token, or None"""
+    info = None
+    if BOT_INFO_JSON:
+        try:
+            info = json.loads(BOT_INFO_JSON)
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid BOT_INFO_JSON: {e}")
+    if info is None:
+        try:
+            info = store_get('bot_info')
+        except Exception as e:
+            logger.warning(f"Could not read cached bot info: {e}")
+    # A rotated token for a different bot must not reuse the old identity
+    if info and str(info.get('id')) == BOT_TOKEN.split(':', 1)[0]:
+        return info
+    return None
+
+async def initialize_bot(bot):
+    """Bot.initialize() without the getMe call when the bot's identity is cached"""
+    info = load_cached_bot_info()
+    if info is None:
+        await bot.initialize()
+        try:
+            store_set('bot_info', bot.bot.to_dict())
+        except Exception as e:
+            logger.warning(f"Could not cache bot info: {e}")
+        return
+    # Same steps as Bot.initialize(), with the cached user in place of get_me()
+    await asyncio.gather(bot._request[0].initialize(), bot._request[1].initialize())
+    bot._bot_user = User.de_json(info, bot)
+    bot._initialized = True
+    logger.info(f"Bot initialized from cached getMe for @{info.get('username')}")
+
 _initialized = False
 _application = None
 _event_loop = None
@@ -1473,46 +2852,34 @@ async def get_application():
     global _application, _initialized
     
     if _application is None:
-        _application = Application.builder().token(BOT_TOKEN).build()
+        _application = (
+            Application.builder()
+            .token(BOT_TOKEN)
+            .persistence(SQLitePersistence())
+            .concurrent_updates(ChatOrderedUpdateProcessor())
+            .build()
+        )
+        get_system_messages()  # Render the AI system prompt once per instance
         
+        # One handler per step state, bound to its step index; button steps match their own choices
+        get_listed_step_handlers = {
+            state: CallbackQueryHandler(
+                partial(get_listed_answer, index=index),
+                pattern='^(' + '|'.join(re.escape(data) for data, _, _ in GET_LISTED_STEPS[index].choices) + ')$'
+            ) if GET_LISTED_STEPS[index].choices else MessageHandler(
+                filters.TEXT & ~filters.COMMAND, partial(get_listed_answer, index=index)
+            )
+            for state, index in GET_LISTED_STEP_STATES.items()
+        }
         get_listed_conv_handler = ConversationHandler(
             entry_points=[CallbackQueryHandler(get_listed_start, pattern='^get_listed$')],
             states={
                 GET_LISTED_CONFIRM: [CallbackQueryHandler(get_listed_confirm)],
-                FOUNDER_EMAIL: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_founder_email)],
-                PROJECT_EMAIL: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_project_email)],
-                PROJECT_NAME_SHORT: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_project_name_short)],
-                PROJECT_CATEGORY: [CallbackQueryHandler(get_project_category, pattern='^category_')],
-                PROJECT_DESC_LONG: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_project_desc_long)],
-                TOKEN_NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_token_name)],
-                TOKEN_TICKER: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_token_ticker)],
-                PROJECT_IMAGE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_project_image)],
-                TOKEN_IMAGE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_token_image)],
-                MIN_RAISE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_min_raise)],
-                MONTHLY_BUDGET: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_monthly_budget)],
-                PERFORMANCE_PACKAGE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_performance_package)],
-                PERFORMANCE_UNLOCK_TIME: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_performance_unlock_time)],
-                INTELLECTUAL_PROPERTY: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_intellectual_property)],
-                DOMAIN: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_domain)],
-                DISCORD: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_discord)],
-                TELEGRAM_LINK: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_telegram_link)],
-                DOCS: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_docs)],
-                X_TWITTER: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_x_twitter)],
-                GITHUB: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_github)],
-                YOUTUBE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_youtube)],
-                MEDIUM: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_medium)],
-                CALENDLY: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_calendly)],
-                INSIDER_PAYOUT_ADDRESS: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_insider_payout_address)],
-                SPENDING_LIMIT_ADDRESSES: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_spending_limit_addresses)],
-                X_ARTICLE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_x_article)],
-                FOUNDERS_SOCIALS: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_founders_socials)],
-                TEAM_BACKGROUND: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_team_background)],
-                TIMELINE: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_timeline)],
-                RECOGNITION: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_recognition)],
-                COMPETITORS_VISION: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_competitors_vision)],
-                MISC: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_misc)],
+                **{state: [step_handler] for state, step_handler in get_listed_step_handlers.items()},
             },
             fallbacks=[CommandHandler('cancel', get_listed_cancel, filters=filters.ChatType.PRIVATE)],
+            name='get_listed',
+            persistent=True,
         )
 
         conv_handler = ConversationHandler(
@@ -1525,24 +2892,17 @@ async def get_application():
                 IMAGE_URL: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_image_url)],
             },
             fallbacks=[CommandHandler('cancel', cancel_handler, filters=filters.ChatType.PRIVATE)],
+            name='support',
+            persistent=True,
         )
 
+        _application.add_handler(TypeHandler(Update, refresh_conversation_state), group=-1)
         _application.add_handler(CommandHandler('start', start_handler, filters=filters.ChatType.PRIVATE))
         _application.add_handler(CommandHandler('help', help_handler, filters=filters.ChatType.PRIVATE))
         _application.add_handler(CommandHandler('cancel', cancel_handler, filters=filters.ChatType.PRIVATE))
         
-        _application.add_handler(CommandHandler('ca', ca_command_handler))
-        _application.add_handler(CommandHandler('web', web_command_handler))
-        _application.add_handler(CommandHandler('docs', docs_command_handler))
-        _application.add_handler(CommandHandler('icos', icos_command_handler))
-        _application.add_handler(CommandHandler('markets', markets_command_handler))
-        _application.add_handler(CommandHandler('twitter', twitter_command_handler))
-        _application.add_handler(CommandHandler('telegram', telegram_command_handler))
-        _application.add_handler(CommandHandler('discord', discord_command_handler))
-        _application.add_handler(CommandHandler('youtube', youtube_command_handler))
-        _application.add_handler(CommandHandler('blog', blog_command_handler))
-        _application.add_handler(CommandHandler('futarchyamm', futarchyamm_command_handler))
-        _application.add_handler(CommandHandler('github', github_command_handler))
+        for command in STATIC_REPLIES:
+            _application.add_handler(CommandHandler(command, static_command_handler(command)))
         
         _application.add_handler(get_listed_conv_handler)
         _application.add_handler(conv_handler)
@@ -1552,106 +2912,249 @@ async def get_application():
         _application.add_handler(MessageHandler(filters.COMMAND, text_handler))
     
     if not _initialized:
+        # Application.initialize() skips the bot once it is initialized
+        await initialize_bot(_application.bot)
         await _application.initialize()
-        await _application.bot.initialize()
+        _initialized = True
+    
+    return _application
+
+# Update de-duplication - Telegram update_ids only grow, so a watermark plus a bounded window
+# of recent ids catches retries without per-update timers. With DEDUP_SHARED the window also
+# lives in the local store, so instances sharing LOCAL_STORE_PATH see each other's updates.
+# Every webhook is answered with 200 and handler errors are only logged, so Telegram never
+# retries a failed update and a seen id is never released.
+DEDUP_WINDOW = int(os.environ.get('DEDUP_WINDOW', 4096))
+DEDUP_SHARED = os.environ.get('DEDUP_SHARED', '').lower() in ('1', 'true', 'yes')
+
+class UpdateDeduplicator:
+    def __init__(self, window=DEDUP_WINDOW, shared=DEDUP_SHARED):
+        self.window = window
+        self.shared = shared
+        self.watermark = 0
+        self._recent = deque()
+        self._recent_ids = set()
+        self._lock = threading.Lock()
+        self.duplicates = 0
+
+    def _remember(self, update_id):
+        self._recent.append(update_id)
+        self._recent_ids.add(update_id)
+        while len(self._recent) > self.window:
+            self._recent_ids.discard(self._recent.popleft())
+        self.watermark = max(self.watermark, update_id)
+
+    def _claim_shared(self, update_id):
+        claimed = store_execute(
+            'INSERT OR IGNORE INTO seen_updates (update_id) VALUES (?) RETURNING update_id', (update_id,)
+        )
+        if claimed and update_id % 256 == 0:
+            store_execute('DELETE FROM seen_updates WHERE update_id < ?', (update_id - self.window,))
+        return bool(claimed)
+
+    def is_duplicate(self, update_id):
+        """Record update_id and report whether it was already seen (or is too old to tell)"""
+        with self._lock:
+            if update_id < self.watermark - self.window:
+                # Telegram restarts update_ids at a random value after a quiet week, so an id far
+                # below the watermark starts a new sequence rather than being an old retry
+                logger.warning(f"Update id {update_id} is far below watermark {self.watermark}, resetting")
+                self._recent.clear()
+                self._recent_ids.clear()
+                self.watermark = 0
+                if self.shared:
+                    try:
+                        store_execute('DELETE FROM seen_updates WHERE update_id > ?', (update_id + self.window,))
+                    except Exception as e:
+                        logger.error(f"Failed to clear shared dedup ids above update {update_id}: {e}")
+            duplicate = update_id in self._recent_ids
+            if not duplicate and self.shared:
+                try:
+                    duplicate = not self._claim_shared(update_id)
+                except Exception as e:
+                    logger.error(f"Shared dedup check failed for update {update_id}: {e}")
+            if duplicate:
+                self.duplicates += 1
+            else:
+                self._remember(update_id)
+            return duplicate
+
+update_deduplicator = UpdateDeduplicator()
+
+# Fast-ack mode - the webhook only validates and enqueues the update, answers 200 straight
+# away, and a background thread running the instance's event loop does the processing
+WEBHOOK_FAST_ACK = os.environ.get('WEBHOOK_FAST_ACK', '').lower() in ('1', 'true', 'yes')
+WEBHOOK_DRAIN_TIMEOUT = float(os.environ.get('WEBHOOK_DRAIN_TIMEOUT', 25))
+
+_background_thread = None
+_background_lock = threading.Lock()
+_inflight_updates = set()
+
+async def process_update_dict(update_dict: dict):
+    """Process one raw webhook update and flush everything it produced"""
+    try:
+        app = await get_application()
         
-        await _application.bot.delete_my_commands()
+        update = Update.de_json(update_dict, app.bot)
         
-        private_commands = [
-            BotCommand("start", "Start the bot and show main menu"),
-            BotCommand("help", "Show help information"),
-            BotCommand("cancel", "Cancel current operation")
-        ]
-        await _application.bot.set_my_commands(private_commands, scope=BotCommandScopeAllPrivateChats())
+        await dispatch_update(app, update)
+        logger.info("Update processed successfully")
         
-        group_commands = [
-            BotCommand("ca", "Get META contract address"),
-            BotCommand("web", "Get MetaDAO website link"),
-            BotCommand("docs", "Get documentation link"),
-            BotCommand("icos", "Get calendar and ICOs link"),
-            BotCommand("markets", "View active markets"),
-            BotCommand("twitter", "Follow us on Twitter/X"),
-            BotCommand("telegram", "Join our Telegram community"),
-            BotCommand("discord", "Join our Discord server"),
-            BotCommand("youtube", "Subscribe to our YouTube"),
-            BotCommand("blog", "Read our blog"),
-            BotCommand("futarchyamm", "View AMM metrics"),
-            BotCommand("github", "Explore our GitHub")
-        ]
-        await _application.bot.set_my_commands(group_commands, scope=BotCommandScopeAllGroupChats())
+        await persist_update_state(app)
         
-        logger.info("Bot commands configured: conversation commands for private chats only, info commands for groups only")
-        _initialized = True
-    
-    return _application
+        # Let queued Sheets writes finish before the serverless invocation is frozen
+        await asyncio.to_thread(flush_submissions)
+        await maybe_replay_outbox(app.bot)
+            
+    except Exception as e:
+        logger.error(f"Error in async update processing: {e}", exc_info=True)
+
+def _ensure_background_loop():
+    global _background_thread
+    with _background_lock:
+        if _background_thread is None or not _background_thread.is_alive():
+            loop = get_event_loop()
+            _background_thread = threading.Thread(target=loop.run_forever, name='update-worker', daemon=True)
+            _background_thread.start()
+            atexit.register(drain_background_updates)
+            logger.info("Started background update worker")
+    return _event_loop
+
+def submit_update(update_dict: dict):
+    """Schedule an update on the background worker without waiting for it"""
+    future = asyncio.run_coroutine_threadsafe(process_update_dict(update_dict), _ensure_background_loop())
+    _inflight_updates.add(future)
+    future.add_done_callback(_inflight_updates.discard)
+    return future
 
-_processing_updates = set()
-_update_cleanup_tasks = {}
+def drain_background_updates(timeout=WEBHOOK_DRAIN_TIMEOUT):
+    """Wait for in-flight background updates and queued Sheets writes, then stop the worker"""
+    if _background_thread is None or not _background_thread.is_alive():
+        return
+    pending = list(_inflight_updates)
+    if pending:
+        logger.info(f"Draining {len(pending)} in-flight update(s)")
+        done, not_done = concurrent.futures.wait(pending, timeout=timeout)
+        if not_done:
+            logger.warning(f"{len(not_done)} update(s) still running after {timeout}s drain")
+    flush_submissions()
+    _event_loop.call_soon_threadsafe(_event_loop.stop)
+    _background_thread.join(timeout=5)
+
+# Ingest pre-filter - in groups only commands and the exact CA text get a reply, so other group
+# messages are acknowledged straight from the raw payload, before Update.de_json and the handlers
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+ingest_stats = {'received': 0, 'dropped': 0, 'inline_replies': 0}
+
+def _raw_command(message: dict):
+    """(command, @target) of a raw message starting with a bot command, else None"""
+    text = message.get('text')
+    entities = message.get('entities') or ()
+    if not isinstance(text, str) or not text.startswith('/') or not entities:
+        return None
+    if entities[0].get('type') != 'bot_command' or entities[0].get('offset') != 0:
+        return None
+    command, _, target = text[1:entities[0].get('length', 0)].partition('@')
+    return command.lower(), target.lower()
+
+def is_actionable_update(update_dict: dict) -> bool:
+    """False for group (edited) messages that no handler would act on"""
+    ingest_stats['received'] += 1
+    message = update_dict.get('message') or update_dict.get('edited_message')
+    if not isinstance(message, dict) or message.get('chat', {}).get('type') not in GROUP_CHAT_TYPES:
+        return True
+    if message.get('text') in CA_TEXTS:
+        return True
+    command = _raw_command(message)
+    if command and command[0] in GROUP_COMMAND_NAMES:
+        return True
+    ingest_stats['dropped'] += 1
+    logger.info(f"Dropped group update {update_dict.get('update_id')} ({ingest_stats['dropped']}/{ingest_stats['received']} shed)")
+    return False
+
+def static_reply_payload(update_dict: dict) -> Optional[bytes]:
+    """sendMessage call to return in the webhook response for a static command or CA trigger.
+
+    Mirrors what the handlers would send, including PTB's default quoting of the command
+    in non-private chats and the topic of forum messages. None when the Application is needed.
+    """
+    message = update_dict.get('message')
+    if not isinstance(message, dict) or not isinstance(message.get('chat'), dict):
+        return None
+    chat = message['chat']
+    if message.get('text') in CA_TEXTS and chat.get('type') in GROUP_CHAT_TYPES:
+        fields = _ca_trigger_fields
+    else:
+        command = _raw_command(message)
+        if not command or command[0] not in _static_command_fields:
+            return None
+        if command[1]:
+            # Commands addressed to another bot are ignored, which needs our own username
+            bot_info = load_cached_bot_info()
+            if not bot_info or command[1] != str(bot_info.get('username', '')).lower():
+                return None
+        fields = _static_command_fields[command[0]]
+    call = {'method': 'sendMessage', 'chat_id': chat['id']}
+    if chat.get('type') != 'private':
+        call['reply_parameters'] = {'message_id': message['message_id']}
+    if message.get('is_topic_message') and 'message_thread_id' in message:
+        call['message_thread_id'] = message['message_thread_id']
+    ingest_stats['inline_replies'] += 1
+    return (json.dumps(call)[:-1] + ', ' + fields).encode('utf-8')
 
 class handler(BaseHTTPRequestHandler):
-    def send_success_response(self):
+    def send_success_response(self, response=None):
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.end_headers()
-        response = json.dumps({'ok': True})
-        self.wfile.write(response.encode('utf-8'))
+        if response is None:
+            response = json.dumps({'ok': True}).encode('utf-8')
+        self.wfile.write(response)
 
     def do_POST(self):
         """Handle POST requests from Telegram webhook"""
-        update_id = None
+        response = None
         try:
             logger.info("Webhook POST request received")
             
             content_length = int(self.headers.get('Content-Length', 0))
             body = self.rfile.read(content_length)
             
-            update_dict = json.loads(body.decode('utf-8'))
+            update_dict = _json_loads(body)
+            if not isinstance(update_dict, dict) or not isinstance(update_dict.get('update_id'), int):
+                logger.warning("Ignoring webhook payload without an update_id")
+                return
+            if not is_actionable_update(update_dict):
+                return
             
             update_id = update_dict.get('update_id')
-            if update_id and update_id in _processing_updates:
+            if update_id and update_deduplicator.is_duplicate(update_id):
                 logger.warning(f"Duplicate update {update_id} detected, skipping")
-                self.send_success_response()
                 return
             
-            if update_id:
-                _processing_updates.add(update_id)
+            # Static replies travel back in the response body, no Application needed
+            response = static_reply_payload(update_dict)
+            if response is not None:
+                logger.info(f"Answered update {update_id} in the webhook response")
+                return
             
             logger.info(f"Processing update {update_id}")
             
-            loop = get_event_loop()
-            loop.run_until_complete(self._process_update_async(update_dict, update_id))
+            if WEBHOOK_FAST_ACK:
+                submit_update(update_dict)
+            else:
+                loop = get_event_loop()
+                loop.run_until_complete(process_update_dict(update_dict))
             
         except Exception as e:
             logger.error(f"Error processing webhook: {e}", exc_info=True)
-            
-            if update_id and update_id in _processing_updates:
-                _processing_updates.discard(update_id)
         finally:
-            self.send_success_response()
-    
-    async def _process_update_async(self, update_dict: dict, update_id: int):
-        """Async function to process update with proper cleanup"""
-        try:
-            app = await get_application()
-            
-            update = Update.de_json(update_dict, app.bot)
-            
-            await app.process_update(update)
-            logger.info("Update processed successfully")
-            
-            await asyncio.sleep(0.5)
-            
-            if update_id:
-                asyncio.create_task(self._cleanup_update_id_delayed(update_id))
-                
-        except Exception as e:
-            logger.error(f"Error in async update processing: {e}", exc_info=True)
-    
-    async def _cleanup_update_id_delayed(self, update_id: int):
-        """Remove update ID from tracking after delay"""
-        await asyncio.sleep(30)
-        _processing_updates.discard(update_id)
-        logger.info(f"Cleaned up update ID: {update_id}")
+            self.send_success_response(response)
 
     def do_GET(self):
         """Handle GET requests for health check"""
@@ -1661,4 +3164,223 @@ class handler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(b'MetaDAO Bot is running!')
 
+# ASGI entry point for long-lived deployments, e.g. `uvicorn api.MetaDAOBot:asgi_app`.
+# One Application and event loop serve every request, and requests are processed concurrently.
+_asgi_tasks = set()
+
+async def _asgi_lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                app = await get_application()
+                await app.start()
+            except Exception as e:
+                logger.error(f"ASGI startup failed: {e}", exc_info=True)
+                await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                return
+            logger.info("ASGI application started")
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if _asgi_tasks:
+                logger.info(f"Draining {len(_asgi_tasks)} in-flight update(s)")
+                await asyncio.wait(list(_asgi_tasks), timeout=WEBHOOK_DRAIN_TIMEOUT)
+            if _application is not None and _application.running:
+                await _application.stop()
+                await persist_update_state(_application)
+                await _application.shutdown()
+            await asyncio.to_thread(flush_submissions)
+            logger.info("ASGI application stopped")
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def _asgi_respond(send, status, body, content_type):
+    await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', content_type)]})
+    await send({'type': 'http.response.body', 'body': body})
+
+async def asgi_app(scope, receive, send):
+    """ASGI alternative to the Vercel `handler`, sharing all handlers and state with it"""
+    if scope['type'] == 'lifespan':
+        await _asgi_lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    if scope['method'] == 'GET':
+        await _asgi_respond(send, 200, b'MetaDAO Bot is running!', b'text/plain')
+        return
+    if scope['method'] != 'POST':
+        await _asgi_respond(send, 405, b'Method Not Allowed', b'text/plain')
+        return
+
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+    response = None
+    try:
+        update_dict = _json_loads(body)
+        if isinstance(update_dict, dict) and isinstance(update_dict.get('update_id'), int):
+            update_id = update_dict['update_id']
+            if not is_actionable_update(update_dict):
+                logger.debug(f"Update {update_id} needs no processing")
+            elif update_deduplicator.is_duplicate(update_id):
+                logger.warning(f"Duplicate update {update_id} detected, skipping")
+            elif (response := static_reply_payload(update_dict)) is not None:
+                logger.info(f"Answered update {update_id} in the webhook response")
+            elif WEBHOOK_FAST_ACK:
+                task = asyncio.create_task(process_update_dict(update_dict))
+                _asgi_tasks.add(task)
+                task.add_done_callback(_asgi_tasks.discard)
+            else:
+                await process_update_dict(update_dict)
+        else:
+            logger.warning("Ignoring webhook payload without an update_id")
+    except Exception as e:
+        logger.error(f"Error processing webhook: {e}", exc_info=True)
+    if response is None:
+        response = json.dumps({'ok': True}).encode('utf-8')
+    await _asgi_respond(send, 200, response, b'application/json')
+
+def _serve_command(args):
+    import uvicorn  # Only needed for self-hosted deployments, not on Vercel
+    uvicorn.run(asgi_app, host=args.host, port=args.port, lifespan='on')
+
+# Long-polling worker for self-hosted deployments - same handlers, no webhook.
+# Run with `python -m api.MetaDAOBot poll` from the repository root.
+POLL_TIMEOUT = int(os.environ.get('POLL_TIMEOUT', 30))
+POLL_PERSIST_INTERVAL = float(os.environ.get('POLL_PERSIST_INTERVAL', 1.0))
+
+async def run_polling_worker():
+    """Fetch updates with getUpdates and process them concurrently until SIGINT/SIGTERM"""
+    app = await get_application()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass  # Windows - rely on KeyboardInterrupt
+
+    # getUpdates returns up to 100 updates per call, the updater confirms each batch by offset
+    await app.updater.start_polling(timeout=POLL_TIMEOUT, allowed_updates=Update.ALL_TYPES)
+    await app.start()
+    started = time.monotonic()
+    logger.info("Polling worker started")
+
+    try:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), POLL_PERSIST_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await persist_update_state(app)
+            # Updates never pass through process_update_dict here, so replay from this loop
+            await maybe_replay_outbox(app.bot)
+    finally:
+        logger.info("Polling worker stopping")
+        await app.updater.stop()
+        await app.stop()
+        await persist_update_state(app)
+        await app.shutdown()
+        await asyncio.to_thread(flush_submissions)
+        elapsed = time.monotonic() - started
+        processed = app.update_processor.processed
+        logger.info(f"Polling worker processed {processed} update(s) in {elapsed:.0f}s ({processed / elapsed if elapsed else 0:.2f}/s)")
+
+# Cold-start guard - `check-import-time` imports this module in fresh interpreters and fails
+# when the import gets slower than the budget or a lazily loaded SDK is imported eagerly again
+IMPORT_TIME_BUDGET_MS = float(os.environ.get('IMPORT_TIME_BUDGET_MS', 600))
+LAZY_MODULES = ('gspread', 'groq', 'google.oauth2.service_account')
+
+def check_import_time(budget_ms=IMPORT_TIME_BUDGET_MS, runs=3):
+    """Median cold import time in ms, checked against budget_ms; returns True when within budget"""
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    code = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module_name}\n"
+        "elapsed = (time.perf_counter() - started) * 1000\n"
+        f"print(json.dumps([elapsed, [m for m in {LAZY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    env = dict(os.environ, BOT_TOKEN=BOT_TOKEN)
+    timings, eager = [], set()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, capture_output=True, text=True, check=True
+        )
+        elapsed, loaded = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(elapsed)
+        eager.update(loaded)
+    median = sorted(timings)[len(timings) // 2]
+    logger.info(f"Cold import: median {median:.0f} ms over {runs} runs (budget {budget_ms:.0f} ms)")
+    if eager:
+        logger.error(f"Modules meant to be lazy were imported eagerly: {', '.join(sorted(eager))}")
+    if median > budget_ms:
+        logger.error(f"Cold import time {median:.0f} ms exceeds the {budget_ms:.0f} ms budget")
+    return median <= budget_ms and not eager
+
+async def _sync_commands_command(args):
+    async with Bot(BOT_TOKEN) as bot:
+        await sync_bot_commands(bot, force=args.force)
+        # Setting this as BOT_INFO_JSON spares every cold instance its getMe call
+        print(json.dumps(bot.bot.to_dict()))
+
+def _project_view_command(args):
+    shown = build_project_view(args.project)
+    if not shown:
+        sys.exit(1)
+
+async def _replay_outbox_command(args):
+    async with Bot(BOT_TOKEN) as bot:
+        delivered = await replay_outbox(bot, limit=args.limit)
+    pruned = outbox_prune()
+    logger.info(f"Outbox replay delivered {delivered} entry(s), pruned {pruned} delivered entry(s)")
+
+def main(argv=None):
+    """Command line entry points, e.g. `python api/MetaDAOBot.py poll` or `... replay-outbox`"""
+    parser = argparse.ArgumentParser(description="MetaDAO bot workers and maintenance commands")
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    replay = subcommands.add_parser('replay-outbox', help="Deliver pending submissions to Sheets and the support chat")
+    replay.add_argument('--limit', type=int, default=500, help="Maximum number of entries to replay")
+    replay.set_defaults(func=lambda args: asyncio.run(_replay_outbox_command(args)))
+
+    sync = subcommands.add_parser('sync-commands', help="Register bot command menus if they changed, print the getMe JSON")
+    sync.add_argument('--force', action='store_true', help="Register even if this version was already registered")
+    sync.set_defaults(func=lambda args: asyncio.run(_sync_commands_command(args)))
+
+    view = subcommands.add_parser('project-view', help="Write a per-project view of the Get Listed table to its own tab")
+    view.add_argument('project', help="Project name, or part of it, as submitted")
+    view.set_defaults(func=_project_view_command)
+
+    poll = subcommands.add_parser('poll', help="Process updates with getUpdates long polling instead of the webhook")
+    poll.set_defaults(func=lambda args: asyncio.run(run_polling_worker()))
+
+    serve = subcommands.add_parser('serve', help="Run the webhook as an ASGI server (requires uvicorn)")
+    serve.add_argument('--host', default='0.0.0.0')
+    serve.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8000)))
+    serve.set_defaults(func=_serve_command)
+
+    import_check = subcommands.add_parser('check-import-time', help="Fail if cold module import exceeds the time budget")
+    import_check.add_argument('--budget-ms', type=float, default=IMPORT_TIME_BUDGET_MS)
+    import_check.add_argument('--runs', type=int, default=3)
+    import_check.set_defaults(func=lambda args: sys.exit(0 if check_import_time(args.budget_ms, args.runs) else 1))
+
+    docs = subcommands.add_parser('build-docs-index', help="Build the retrieval index from a local docs snapshot")
+    docs.add_argument('--snapshot', default=DOCS_SNAPSHOT_DIR, help="Directory of saved docs.metadao.fi pages")
+    docs.add_argument('--output', default=DOCS_INDEX_PATH, help="Index file to write")
+    docs.set_defaults(func=lambda args: build_docs_index(args.snapshot, args.output))
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
 logger.info("Module loaded successfully")
+
+if __name__ == '__main__':
+    main()